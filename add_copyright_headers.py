@@ -5,7 +5,8 @@ This helps establish ownership and legal protection.
 """
 
 import os
-import glob
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Copyright header templates
@@ -35,56 +36,142 @@ TYPESCRIPT_HEADER = '''/*
 
 '''
 
+# Pre-encoded forms so the per-file path never re-encodes the templates
+PYTHON_HEADER_BYTES = PYTHON_HEADER.encode('utf-8')
+TYPESCRIPT_HEADER_BYTES = TYPESCRIPT_HEADER.encode('utf-8')
+HEADER_MARKER = 'Copyright © 2024 TwinSecure'.encode('utf-8')
+
+# The header always sits at the top of the file, well inside this window
+HEADER_SCAN_BYTES = 4096
+
+# Read chunk size, and the buffer used where os.writev is unavailable
+WRITE_BUFFER_SIZE = 1 << 18
+
+
+def _read_all(fd):
+    """Read the remainder of an open file descriptor."""
+    chunks = []
+    while True:
+        chunk = os.read(fd, WRITE_BUFFER_SIZE)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+
+def _write_vectored(fd, buffers):
+    """Write buffers in order with os.writev, resuming after short writes."""
+    buffers = [memoryview(b) for b in buffers if b]
+    while buffers:
+        written = os.writev(fd, buffers)
+        while buffers and written >= len(buffers[0]):
+            written -= len(buffers[0])
+            buffers.pop(0)
+        if buffers and written:
+            buffers[0] = buffers[0][written:]
+
+
 def add_header_to_file(file_path, header):
-    """Add copyright header to a file if it doesn't already exist."""
+    """
+    Add copyright header to a file if it doesn't already exist.
+
+    Returns a status line for the caller to report, so worker threads
+    never contend on stdout.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        fd = os.open(file_path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+        try:
+            head = os.read(fd, HEADER_SCAN_BYTES)
+
+            # Check if copyright header already exists
+            if HEADER_MARKER in head:
+                return f"Header already exists in {file_path}"
+
+            rest = _read_all(fd)
+
+            # Header plus body is longer than the original, so rewriting
+            # from offset 0 needs no truncate
+            os.lseek(fd, 0, os.SEEK_SET)
+            if hasattr(os, 'writev'):
+                # Let the kernel gather header and body in one call
+                _write_vectored(fd, (header, head, rest))
+            else:
+                with open(fd, 'wb', buffering=WRITE_BUFFER_SIZE, closefd=False) as f:
+                    f.write(header)
+                    f.write(head)
+                    f.write(rest)
+        finally:
+            os.close(fd)
+
+        return f"Added header to {file_path}"
 
-        # Check if copyright header already exists
-        if 'Copyright © 2024 TwinSecure' in content:
-            print(f"Header already exists in {file_path}")
-            return
+    except Exception as e:
+        return f"Error processing {file_path}: {e}"
 
-        # Add header at the beginning
-        new_content = header + content
+# Directories that never contain project sources
+EXCLUDED_DIRS = frozenset({'__pycache__', 'venv', 'node_modules'})
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+PYTHON_SUFFIXES = ('.py',)
+TYPESCRIPT_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx')
 
-        print(f"Added header to {file_path}")
+# (root, suffixes, recursive) triples walked by main()
+SCAN_ROOTS = (
+    ('backend/app', PYTHON_SUFFIXES, True),
+    ('backend/scripts', PYTHON_SUFFIXES, True),
+    ('backend/tests', PYTHON_SUFFIXES, True),
+    ('.', PYTHON_SUFFIXES, False),
+    ('frontend/src', TYPESCRIPT_SUFFIXES, True),
+)
+
+
+def _scan(root, suffixes, exclude=EXCLUDED_DIRS, recursive=True):
+    """Yield paths under root ending with one of suffixes, pruning excluded dirs."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and entry.name not in exclude:
+                        yield from _scan(entry.path, suffixes, exclude, recursive)
+                elif entry.name.endswith(suffixes):
+                    yield entry.path
+    except FileNotFoundError:
+        return
+
+
+def header_for(file_path):
+    """Return the header template matching the file's extension."""
+    if file_path.endswith(PYTHON_SUFFIXES):
+        return PYTHON_HEADER_BYTES
+    return TYPESCRIPT_HEADER_BYTES
+
+
+def iter_source_files():
+    """Yield every source file under SCAN_ROOTS exactly once."""
+    seen = set()
+
+    for root, suffixes, recursive in SCAN_ROOTS:
+        for file_path in _scan(root, suffixes, recursive=recursive):
+            key = os.path.realpath(file_path)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield file_path
+
+
+def _process(file_path):
+    return add_header_to_file(file_path, header_for(file_path))
 
-    except Exception as e:
-        print(f"Error processing {file_path}: {e}")
 
 def main():
     """Main function to add headers to all relevant files."""
+    # Each file is an independent read/compare/write, so overlap the I/O
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_process, iter_source_files()))
 
-    # Python files
-    python_patterns = [
-        'backend/app/**/*.py',
-        'backend/scripts/**/*.py',
-        'backend/tests/**/*.py',
-        '*.py'
-    ]
-
-    for pattern in python_patterns:
-        for file_path in glob.glob(pattern, recursive=True):
-            if '__pycache__' not in file_path and 'venv' not in file_path:
-                add_header_to_file(file_path, PYTHON_HEADER)
-
-    # TypeScript/JavaScript files
-    ts_patterns = [
-        'frontend/src/**/*.ts',
-        'frontend/src/**/*.tsx',
-        'frontend/src/**/*.js',
-        'frontend/src/**/*.jsx'
-    ]
-
-    for pattern in ts_patterns:
-        for file_path in glob.glob(pattern, recursive=True):
-            if 'node_modules' not in file_path:
-                add_header_to_file(file_path, TYPESCRIPT_HEADER)
+    if results:
+        sys.stdout.write("\n".join(results) + "\n")
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
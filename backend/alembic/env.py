@@ -1,4 +1,5 @@
 import asyncio # Import asyncio
+import functools
 from logging.config import fileConfig
 
 from sqlalchemy import pool
@@ -25,22 +26,32 @@ if config.config_file_name is not None:
 import os
 import sys
 from app.core.config import settings # Import your application settings
-from app.db.base import Base # Import your Base model from your app structure
 
 # Add the project root directory to the Python path
 # This allows Alembic to find your app modules (like models, base)
 sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), "..")))
 
-target_metadata = Base.metadata # Use the metadata from your Base
+
+@functools.cache
+def get_target_metadata():
+    """Import the models lazily; offline SQL generation never needs them."""
+    from app.db.base import Base # Import your Base model from your app structure
+
+    return Base.metadata # Use the metadata from your Base
 
 # Use DATABASE_URL from your application settings
 # Instead of setting it in the config, we'll use it directly in the engine creation
-db_url = settings.DATABASE_URL
+db_url = settings.database.DATABASE_URL
 if not db_url:
     raise ValueError("DATABASE_URL environment variable is not set for Alembic.")
 
 # Print the database URL for debugging
-print(f"Database URL: {db_url}")
+if os.getenv("ALEMBIC_DEBUG"):
+    print(f"Database URL: {db_url}")
+
+# Column type comparison is only needed when autogenerating revisions;
+# set ALEMBIC_COMPARE_TYPE=1 for autogenerate, leave unset for deploys
+compare_type = os.getenv("ALEMBIC_COMPARE_TYPE") == "1"
 
 # --- END TwinSecure Configuration ---
 
@@ -66,10 +77,9 @@ def run_migrations_offline() -> None:
     # Use the db_url directly instead of getting it from config
     context.configure(
         url=db_url,
-        target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
-        compare_type=True, # Compare column types during autogenerate
+        compare_type=compare_type, # Compare column types during autogenerate
     )
 
     with context.begin_transaction():
@@ -81,8 +91,8 @@ def do_run_migrations(connection: Connection) -> None:
     """Helper function to run migrations using a synchronous connection."""
     context.configure(
         connection=connection,
-        target_metadata=target_metadata,
-        compare_type=True, # Compare column types during autogenerate
+        target_metadata=get_target_metadata(),
+        compare_type=compare_type, # Compare column types during autogenerate
     )
 
     with context.begin_transaction():
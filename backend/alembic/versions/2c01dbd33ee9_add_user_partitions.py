@@ -16,32 +16,33 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade():
-    # Create partitions for each role
-    op.execute("""
-    CREATE TABLE users_admin PARTITION OF users
-    FOR VALUES IN ('ADMIN');
-    """)
+# Role partitions to create; adding a role is a one-line edit here
+ROLES = ('admin', 'analyst', 'viewer', 'api_user')
+_ROLE_ARRAY = "ARRAY[" + ", ".join(f"'{role}'" for role in ROLES) + "]"
 
-    op.execute("""
-    CREATE TABLE users_analyst PARTITION OF users
-    FOR VALUES IN ('ANALYST');
-    """)
 
-    op.execute("""
-    CREATE TABLE users_viewer PARTITION OF users
-    FOR VALUES IN ('VIEWER');
-    """)
-
-    op.execute("""
-    CREATE TABLE users_api_user PARTITION OF users
-    FOR VALUES IN ('API_USER');
+def upgrade():
+    # Create partitions for each role in a single round-trip
+    op.execute(f"""
+    DO $$
+    DECLARE r text;
+    BEGIN
+      FOREACH r IN ARRAY {_ROLE_ARRAY} LOOP
+        EXECUTE format('CREATE TABLE users_%s PARTITION OF users FOR VALUES IN (%L)',
+                       r, upper(r));
+      END LOOP;
+    END $$;
     """)
 
 
 def downgrade():
     # Drop partitions
-    op.execute("DROP TABLE IF EXISTS users_admin;")
-    op.execute("DROP TABLE IF EXISTS users_analyst;")
-    op.execute("DROP TABLE IF EXISTS users_viewer;")
-    op.execute("DROP TABLE IF EXISTS users_api_user;")
+    op.execute(f"""
+    DO $$
+    DECLARE r text;
+    BEGIN
+      FOREACH r IN ARRAY {_ROLE_ARRAY} LOOP
+        EXECUTE format('DROP TABLE IF EXISTS users_%s', r);
+      END LOOP;
+    END $$;
+    """)
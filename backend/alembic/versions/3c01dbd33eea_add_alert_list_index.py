@@ -0,0 +1,30 @@
+"""Add alert list index
+
+Revision ID: 3c01dbd33eea
+Revises: 2c01dbd33ee9
+Create Date: 2025-05-16 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c01dbd33eea'
+down_revision = '2c01dbd33ee9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves the alert list filters (severity/status) and its newest-first sort
+    op.create_index(
+        'ix_alerts_severity_status_triggered_at',
+        'alerts',
+        ['severity', 'status', sa.text('triggered_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_alerts_severity_status_triggered_at', table_name='alerts')
@@ -0,0 +1,30 @@
+"""Add report list index
+
+Revision ID: 4c01dbd33eeb
+Revises: 3c01dbd33eea
+Create Date: 2025-05-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4c01dbd33eeb'
+down_revision = '3c01dbd33eea'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves the report list's keyset pagination on (generated_at, id), newest first
+    op.create_index(
+        'ix_reports_generated_at_id',
+        'reports',
+        [sa.text('generated_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_reports_generated_at_id', table_name='reports')
@@ -9,44 +9,75 @@ is strictly prohibited without explicit written permission.
 For licensing inquiries: kunalsingh2514@gmail.com
 """
 
+import functools
+import importlib
+
 from fastapi import APIRouter
 
-# Import endpoint routers
-from app.api.api_v1.endpoints import (
-    alerts,
-    auth,
-    dashboard,
-    honeypot,
-    reports,
-    system,
-    users,
+# Endpoint modules (under app.api.api_v1.endpoints) whose routers are
+# included, with their prefixes and tags, in inclusion order. Modules are
+# imported only when the router is built.
+_ENDPOINT_SPECS = (
+    ("auth", "/auth", ["Authentication"]),
+    ("alerts", "/alerts", ["Alerts"]),
+    ("reports", "/reports", ["Reports"]),
+    ("honeypot", "/honeypot", ["Honeypot"]),
+    ("system", "/system", ["System Status"]),
+    ("dashboard", "/dashboard", ["Dashboard"]),
+    # Optional: user management endpoints
+    ("users", "/users", ["Users"]),
 )
 
-# Create the main router for API version 1
-api_router = APIRouter()
-
-# Include endpoint routers with prefixes and tags
-api_router.include_router(auth, prefix="/auth", tags=["Authentication"])
-api_router.include_router(alerts, prefix="/alerts", tags=["Alerts"])
-api_router.include_router(reports, prefix="/reports", tags=["Reports"])
-api_router.include_router(honeypot, prefix="/honeypot", tags=["Honeypot"])
-api_router.include_router(system, prefix="/system", tags=["System Status"])
-api_router.include_router(dashboard, prefix="/dashboard", tags=["Dashboard"])
-
-# Optional: Include user management endpoints if needed
-api_router.include_router(users, prefix="/users", tags=["Users"])
-
 
 # You could add a root endpoint for the v1 API here if desired
-@api_router.get("/", status_code=200)
 def read_api_root():
     return {"message": "Welcome to TwinSecure AI API v1"}
 
 
 # Health check endpoint for the API
-@api_router.get("/health", status_code=200)
 def health_check():
     """
     Health check endpoint for the API.
     """
     return {"status": "ok", "message": "API is healthy"}
+
+
+def include_api_routes(router, prefix: str = "") -> None:
+    """
+    Add every API version 1 route to router under prefix.
+
+    Endpoint routers are included directly with their full prefix, so each
+    route is cloned once onto the target (an app or router) instead of once
+    per level of nesting.
+    """
+    for name, sub_prefix, tags in _ENDPOINT_SPECS:
+        module = importlib.import_module(f".endpoints.{name}", __package__)
+        router.include_router(module.router, prefix=prefix + sub_prefix, tags=tags)
+    router.add_api_route(
+        prefix + "/", read_api_root, methods=["GET"], status_code=200
+    )
+    router.add_api_route(
+        prefix + "/health", health_check, methods=["GET"], status_code=200
+    )
+
+
+@functools.cache
+def get_api_router() -> APIRouter:
+    """
+    Build the main router for API version 1.
+
+    The router is built once per process; repeated callers (app reloads,
+    tests) share the same instance instead of re-including every route.
+    The application itself uses include_api_routes() to skip this level.
+    """
+    router = APIRouter()
+    include_api_routes(router)
+    return router
+
+
+def __getattr__(name: str):
+    # Build the main router for API version 1 on first access, so importing
+    # this module does not pull in every endpoint module.
+    if name == "api_router":
+        return get_api_router()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,13 +11,8 @@ For licensing inquiries: kunalsingh2514@gmail.com
 
 # app/api/api_v1/endpoints/__init__.py
 
-from .alerts import router as alerts
-from .auth import router as auth
-from .dashboard import router as dashboard
-from .honeypot import router as honeypot
-from .reports import router as reports
-from .system import router as system
-from .users import users
+# Endpoint modules are imported on demand; app.api.api_v1.api includes each
+# module's `router`.
 
 # List all modules in __all__ for better imports
 __all__ = ["auth", "users", "alerts", "reports", "honeypot", "system", "dashboard"]
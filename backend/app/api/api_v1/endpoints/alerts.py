@@ -9,13 +9,27 @@ is strictly prohibited without explicit written permission.
 For licensing inquiries: kunalsingh2514@gmail.com
 """
 
+import hashlib
+import logging
+from functools import lru_cache
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import logger
+from app.api.api_v1.streaming import stream_json_array
+from app.core.config import logger, settings
 from app.core.dependencies import (  # Or get_current_active_superuser if needed
     get_current_active_superuser,
     get_current_active_user,
@@ -24,14 +38,61 @@ from app.db import crud
 from app.db.models import User  # Import User model for dependency
 from app.db.session import get_db
 from app.schemas import Alert, AlertCreate, AlertQueryFilters, AlertUpdate
-
-# Import alerting services
-from app.services.alerting.client import alert_client
+from app.services.cache import redis_cache
 
 router = APIRouter()
 
+# Single alerts change rarely and are invalidated on update; filtered lists
+# also change when alerts are created, so they only live briefly.
+ALERT_CACHE_TTL = settings.cache.CACHE_TTL
+ALERT_LIST_CACHE_TTL = settings.cache.CACHE_DEFAULT_TTL
+
+# Pages larger than this are streamed row by row instead of buffered (and
+# therefore are not cached)
+ALERT_STREAM_THRESHOLD = 250
+
+# Built once at import rather than per request
+_ALERT_LIST_ADAPTER = TypeAdapter(List[Alert])
+
+
+def _alert_cache_key(alert_id: UUID) -> str:
+    return f"alert:{alert_id}"
+
+
+def _alert_list_cache_key(filters: AlertQueryFilters) -> str:
+    digest = hashlib.sha1(filters.model_dump_json().encode()).hexdigest()
+    return f"alerts:list:{digest}"
+
+
+async def _invalidate_alert_cache(alert_id: Optional[UUID] = None) -> None:
+    if alert_id is not None:
+        await redis_cache.delete(_alert_cache_key(alert_id))
+    await redis_cache.delete_pattern("alerts:list:*")
+    # Dashboard aggregates are computed from the same alerts
+    await redis_cache.delete_pattern("dashboard:*")
+
+
+@lru_cache(maxsize=1)
+def _get_alert_client():
+    # Import alerting services on first use; only the write endpoints notify
+    from app.services.alerting.client import alert_client
+
+    return alert_client
+
+
+async def _send_alert_notifications(alert_data: dict, kind: str = "Alert") -> None:
+    """Send alert notifications, logging (not raising) any failure."""
+    try:
+        notification_results = await _get_alert_client().send_alert(alert_data=alert_data)
+        logger.info("%s notifications sent with results: %s", kind, notification_results)
+    except Exception as e:
+        logger.error("Failed to send %s notifications: %s", kind.lower(), e)
 
-@router.get("/", response_model=List[Alert])
+
+# The GET handlers serialize with the schema (or list adapter) and return a
+# Response, which FastAPI passes through without re-validating it against
+# response_model; response_model is kept for the OpenAPI schema only.
+@router.get("/", response_model=List[Alert], response_class=ORJSONResponse)
 async def read_alerts(
     db: AsyncSession = Depends(get_db),
     # Use Depends(AlertQueryFilters) to automatically parse query params into the schema
@@ -42,12 +103,32 @@ async def read_alerts(
     Retrieve a list of alerts based on query filters.
     Requires authentication.
     """
-    logger.info(
-        f"User {current_user.email} fetching alerts with filters: {filters.model_dump(exclude_none=True)}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "User %s fetching alerts with filters: %s",
+            current_user.email,
+            filters.model_dump(exclude_none=True),
+        )
+    if filters.limit > ALERT_STREAM_THRESHOLD:
+        return StreamingResponse(
+            stream_json_array(
+                lambda db: crud.alert.stream_multi(db, filters=filters), Alert
+            ),
+            media_type="application/json",
+        )
+
+    cache_key = _alert_list_cache_key(filters)
+    cached = await redis_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     alerts = await crud.alert.get_multi(db=db, filters=filters)
-    logger.info(f"Found {len(alerts)} alerts matching criteria.")
-    return alerts
+    logger.info("Found %d alerts matching criteria.", len(alerts))
+    body = _ALERT_LIST_ADAPTER.dump_json(
+        _ALERT_LIST_ADAPTER.validate_python(alerts, from_attributes=True)
+    )
+    await redis_cache.set(cache_key, body, ALERT_LIST_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{alert_id}", response_model=Alert)
@@ -60,15 +141,22 @@ async def read_alert(
     Retrieve a specific alert by its ID.
     Requires authentication.
     """
-    logger.info(f"User {current_user.email} fetching alert with ID: {alert_id}")
+    logger.info("User %s fetching alert with ID: %s", current_user.email, alert_id)
+    cache_key = _alert_cache_key(alert_id)
+    cached = await redis_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     db_alert = await crud.alert.get(db=db, alert_id=alert_id)
     if db_alert is None:
-        logger.warning(f"Alert not found: {alert_id}")
+        logger.warning("Alert not found: %s", alert_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found"
         )
-    logger.info(f"Alert found: {alert_id}")
-    return db_alert
+    logger.info("Alert found: %s", alert_id)
+    body = Alert.model_validate(db_alert).model_dump_json()
+    await redis_cache.set(cache_key, body, ALERT_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
 # POST endpoint might be less common here if alerts are created by honeypot/ML module
@@ -78,6 +166,7 @@ async def create_alert(
     *,
     db: AsyncSession = Depends(get_db),
     alert_in: AlertCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(
         get_current_active_superuser
     ),  # Require superuser to create alerts manually?
@@ -85,13 +174,19 @@ async def create_alert(
     """
     Create a new alert manually (requires appropriate permissions).
     """
-    logger.info(
-        f"User {current_user.email} attempting to create alert: {alert_in.model_dump(exclude_none=True)}"
-    )
-    alert = await crud.alert.create(db=db, obj_in=alert_in)
-    logger.info(f"Alert created successfully with ID: {alert.id}")
+    # Dump the payload once and reuse it for the log line and the insert
+    alert_data_in = alert_in.model_dump()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "User %s attempting to create alert: %s",
+            current_user.email,
+            {k: v for k, v in alert_data_in.items() if v is not None},
+        )
+    alert = await crud.alert.create(db=db, obj_in=alert_data_in)
+    logger.info("Alert created successfully with ID: %s", alert.id)
+    await _invalidate_alert_cache()
 
-    # Send alert notifications
+    # Send alert notifications after the response has gone out
     try:
         alert_data = {
             "id": str(alert.id),
@@ -101,11 +196,9 @@ async def create_alert(
             "source_ip": str(alert.source_ip) if alert.source_ip else None,
             "created_at": alert.created_at.isoformat() if alert.created_at else None,
         }
-
-        notification_results = await alert_client.send_alert(alert_data=alert_data)
-        logger.info(f"Alert notifications sent with results: {notification_results}")
+        background_tasks.add_task(_send_alert_notifications, alert_data)
     except Exception as e:
-        logger.error(f"Failed to send alert notifications: {str(e)}")
+        logger.error("Failed to send alert notifications: %s", e)
 
     return alert
 
@@ -116,6 +209,7 @@ async def update_alert(
     db: AsyncSession = Depends(get_db),
     alert_id: UUID,
     alert_in: AlertUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(
         get_current_active_user
     ),  # Allow analysts to update status/notes
@@ -124,27 +218,31 @@ async def update_alert(
     Update an existing alert (e.g., change status, add notes).
     Requires authentication.
     """
-    logger.info(
-        f"User {current_user.email} attempting to update alert {alert_id} with data: {alert_in.model_dump(exclude_unset=True)}"
-    )
-    db_alert = await crud.alert.get(db=db, alert_id=alert_id)
-    if not db_alert:
-        logger.warning(f"Update failed: Alert not found: {alert_id}")
+    # Dump the patch once and reuse it for the log line and the UPDATE
+    patch_data = alert_in.model_dump(exclude_unset=True)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "User %s attempting to update alert %s with data: %s",
+            current_user.email,
+            alert_id,
+            patch_data,
+        )
+    result = await crud.alert.update_by_id(db=db, alert_id=alert_id, obj_in=patch_data)
+    if result is None:
+        logger.warning("Update failed: Alert not found: %s", alert_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found"
         )
+    updated_alert, previous_status = result
+    logger.info("Alert %s updated successfully.", alert_id)
+    await _invalidate_alert_cache(alert_id)
 
-    # Check if status is being updated
+    # Check if status was changed by this update
     status_changed = (
-        hasattr(alert_in, "status")
-        and alert_in.status is not None
-        and alert_in.status != db_alert.status
+        alert_in.status is not None and alert_in.status != previous_status
     )
 
-    updated_alert = await crud.alert.update(db=db, db_obj=db_alert, obj_in=alert_in)
-    logger.info(f"Alert {alert_id} updated successfully.")
-
-    # Send notification if status changed
+    # Send notification if status changed, after the response has gone out
     if status_changed:
         try:
             alert_data = {
@@ -161,13 +259,11 @@ async def update_alert(
                     else None
                 ),
             }
-
-            notification_results = await alert_client.send_alert(alert_data=alert_data)
-            logger.info(
-                f"Alert status change notifications sent with results: {notification_results}"
+            background_tasks.add_task(
+                _send_alert_notifications, alert_data, "Alert status change"
             )
         except Exception as e:
-            logger.error(f"Failed to send alert status change notifications: {str(e)}")
+            logger.error("Failed to send alert status change notifications: %s", e)
 
     return updated_alert
 
@@ -35,25 +35,22 @@ async def login_for_access_token(
 
     Uses username (which is email in our case) and password from form data.
     """
-    logger.info(f"Login attempt for user: {form_data.username}")
-    user = await crud.user.authenticate(
+    logger.info("Login attempt for user: %s", form_data.username)
+    user = await crud.user.authenticate_active(
         db, email=form_data.username, password=form_data.password
     )
     if not user:
-        logger.warning(f"Authentication failed for user: {form_data.username}")
+        # Unknown email, wrong password and inactive account are deliberately
+        # indistinguishable to the client
+        logger.warning("Authentication failed for user: %s", form_data.username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    elif not user.is_active:
-        logger.warning(f"Authentication failed for inactive user: {form_data.username}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
-        )
 
     access_token = security.create_access_token(subject=user.id)
-    logger.info(f"Login successful, token generated for user: {user.email}")
+    logger.info("Login successful, token generated for user: %s", user.email)
     return {"access_token": access_token, "token_type": "bearer"}
 
 
@@ -77,5 +74,5 @@ async def read_users_me(
     """
     Get current logged-in user's details.
     """
-    logger.info(f"Fetching details for current user: {current_user.email}")
+    logger.info("Fetching details for current user: %s", current_user.email)
     return current_user
@@ -9,20 +9,24 @@ is strictly prohibited without explicit written permission.
 For licensing inquiries: kunalsingh2514@gmail.com
 """
 
+import asyncio
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import logger
+from app.core.config import logger, settings
+from app.core.enums import AlertType
 from app.db import crud
-from app.db.session import get_db
 from app.schemas import AlertCreate, HoneypotData  # Use AlertCreate for DB entry
 from app.services.alerting.client import alert_client
+from app.services.alerts_buffer import alerts_buffer
+from app.services.cache import redis_cache
 from app.services.enrichment.abuseipdb import get_abuseipdb_score
 
 # Import enrichment and alerting services
 from app.services.enrichment.geoip import get_geoip_data
+from app.services.job_queue import JobQueue
 from app.services.validation import validate_ip
 
 router = APIRouter()
@@ -32,7 +36,7 @@ async def process_honeypot_data(db: AsyncSession, data: HoneypotData):
     """
     Background task to process honeypot data: enrich, store, alert.
     """
-    logger.info(f"Processing honeypot data for IP: {data.source_ip}")
+    logger.info("Processing honeypot data for IP: %s", data.source_ip)
     ip_info = None
     abuse_score = None
     alert_payload = data.model_dump()  # Use the raw data as part of the alert payload
@@ -40,20 +44,34 @@ async def process_honeypot_data(db: AsyncSession, data: HoneypotData):
     # Validate IP address
     ip_str = str(data.source_ip)
     if not validate_ip(ip_str):
-        logger.warning(f"Invalid IP address format: {ip_str}")
+        logger.warning("Invalid IP address format: %s", ip_str)
         return
 
     try:
-        # 1. Enrich IP address (GeoIP, AbuseIPDB)
-        ip_info = await get_geoip_data(ip_str)
-        abuse_score = await get_abuseipdb_score(ip_str)
+        # 1. Enrich IP address (GeoIP, AbuseIPDB). The lookups are
+        # independent, so run them concurrently; a failing provider only
+        # leaves its own field empty.
+        ip_info, abuse_score = await asyncio.gather(
+            get_geoip_data(ip_str),
+            get_abuseipdb_score(ip_str),
+            return_exceptions=True,
+        )
+        if isinstance(ip_info, Exception):
+            logger.warning("GeoIP lookup failed for %s: %s", ip_str, ip_info)
+            ip_info = None
+        if isinstance(abuse_score, Exception):
+            logger.warning("AbuseIPDB lookup failed for %s: %s", ip_str, abuse_score)
+            abuse_score = None
         logger.debug(
-            f"Enrichment for {data.source_ip}: Geo={ip_info}, AbuseScore={abuse_score}"
+            "Enrichment for %s: Geo=%s, AbuseScore=%s",
+            data.source_ip,
+            ip_info,
+            abuse_score,
         )
 
         # 2. Create Alert record in database
         alert_in = AlertCreate(
-            alert_type="Honeypot Triggered",
+            alert_type=AlertType.HONEYPOT_TRIGGER,
             source_ip=data.source_ip,
             ip_info=ip_info,
             payload=alert_payload,  # Store the received data
@@ -62,10 +80,26 @@ async def process_honeypot_data(db: AsyncSession, data: HoneypotData):
             status="new",
             triggered_at=data.timestamp,  # Use timestamp from data if reliable
         )
-        created_alert = await crud.alert.create(db=db, obj_in=alert_in)
-        logger.info(
-            f"Honeypot alert created in DB for IP {data.source_ip}, Alert ID: {created_alert.id}"
-        )
+        # Queue it for the next batched write; fall back to a direct insert
+        # when the buffer is not running (or is full)
+        created_alert = alerts_buffer.submit(alert_in)
+        if created_alert is not None:
+            logger.info(
+                "Honeypot alert queued for IP %s, Alert ID: %s",
+                data.source_ip,
+                created_alert.id,
+            )
+        else:
+            created_alert = await crud.alert.create(db=db, obj_in=alert_in)
+            logger.info(
+                "Honeypot alert created in DB for IP %s, Alert ID: %s",
+                data.source_ip,
+                created_alert.id,
+            )
+
+            # Drop cached alert lists and dashboard aggregates that predate it
+            await redis_cache.delete_pattern("alerts:list:*")
+            await redis_cache.delete_pattern("dashboard:*")
 
         # 3. Trigger external alerts (Slack, Email, Discord)
         # Pass the enriched data and DB alert object to the alerting client
@@ -73,18 +107,21 @@ async def process_honeypot_data(db: AsyncSession, data: HoneypotData):
             alert_data=created_alert
         )  # Pass the created alert object
         logger.info(
-            f"External alert sent for honeypot trigger from IP {data.source_ip}"
+            "External alert sent for honeypot trigger from IP %s",
+            data.source_ip,
         )
 
     except Exception as e:
         logger.error(
-            f"Error processing honeypot data for IP {data.source_ip}: {e}",
+            "Error processing honeypot data for IP %s: %s",
+            data.source_ip,
+            e,
             exc_info=True,
         )
         # Optionally, create a simpler alert indicating processing failure
         try:
             alert_in_error = AlertCreate(
-                alert_type="Honeypot Processing Error",
+                alert_type=AlertType.SYSTEM_ERROR,
                 source_ip=data.source_ip,
                 payload={"error": str(e), "original_data": alert_payload},
                 severity="high",
@@ -94,10 +131,20 @@ async def process_honeypot_data(db: AsyncSession, data: HoneypotData):
             await crud.alert.create(db=db, obj_in=alert_in_error)
         except Exception as db_err:
             logger.error(
-                f"CRITICAL: Failed to log honeypot processing error to DB: {db_err}"
+                "CRITICAL: Failed to log honeypot processing error to DB: %s",
+                db_err,
             )
 
 
+# Processed by workers that each open their own session (started in the lifespan)
+honeypot_queue = JobQueue(
+    "Honeypot",
+    process_honeypot_data,
+    workers=settings.HONEYPOT_WORKERS,
+    max_size=settings.HONEYPOT_QUEUE_MAX_SIZE,
+)
+
+
 # Note: This endpoint should ideally be secured (e.g., IP whitelisting, secret header)
 # if it's exposed externally, even though it receives data from internal systems like AWS WAF.
 @router.post("/", status_code=status.HTTP_202_ACCEPTED)
@@ -107,7 +154,6 @@ async def receive_honeypot_trigger(
     # Pydantic model for the expected body structure
     honeypot_data: HoneypotData,
     background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
 ):
     """
     Receives mirrored traffic data (e.g., from AWS WAF logs via Kinesis/Lambda).
@@ -126,11 +172,25 @@ async def receive_honeypot_trigger(
 
     client_ip = request.client.host if request.client else "unknown"
     logger.info(
-        f"Received honeypot trigger from client IP: {client_ip}, for source IP: {honeypot_data.source_ip}"
+        "Received honeypot trigger from client IP: %s, for source IP: %s",
+        client_ip,
+        honeypot_data.source_ip,
     )
 
-    # Add processing to background tasks to respond quickly
-    background_tasks.add_task(process_honeypot_data, db, honeypot_data)
+    # Hand processing to the honeypot workers to respond quickly. Without
+    # running workers (e.g. no lifespan), run the job after the response in
+    # its own session rather than the request-scoped one.
+    if honeypot_queue.running:
+        try:
+            honeypot_queue.enqueue(honeypot_data)
+        except asyncio.QueueFull:
+            logger.warning("Honeypot queue full; rejecting trigger from %s", client_ip)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Honeypot processing queue is full, retry later",
+            )
+    else:
+        background_tasks.add_task(honeypot_queue.run, honeypot_data)
 
     logger.debug("Honeypot data processing added to background task queue.")
     return {
@@ -9,18 +9,35 @@ is strictly prohibited without explicit written permission.
 For licensing inquiries: kunalsingh2514@gmail.com
 """
 
+import logging
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.api_v1.streaming import stream_json_array
 from app.core.config import logger
 from app.core.dependencies import get_current_active_superuser, get_current_active_user
 from app.db import crud
 from app.db.models import User
 from app.db.session import get_db
-from app.schemas import Report, ReportCreate, ReportQueryFilters, ReportUpdate
+from app.schemas import (
+    Report,
+    ReportCreate,
+    ReportListItem,
+    ReportQueryFilters,
+    ReportUpdate,
+)
 from app.services.alerting.client import alert_client
 
 # Import PDF generation service and alerting
@@ -28,23 +45,60 @@ from app.services.pdf_generator import generate_report_pdf  # Placeholder functi
 
 router = APIRouter()
 
+# Columns loaded for the report list (download_url is not a column)
+REPORT_LIST_COLUMNS = tuple(
+    field for field in ReportListItem.model_fields if field != "download_url"
+)
 
-@router.get("/list", response_model=List[Report])
+
+@router.get("/list", response_model=List[ReportListItem])
 async def list_reports(
+    response: Response,
+    stream: bool = Query(
+        False, description="Stream every matching report, ignoring limit"
+    ),
     db: AsyncSession = Depends(get_db),
     filters: ReportQueryFilters = Depends(),
     current_user: User = Depends(get_current_active_user),
 ):
     """
-    Retrieve a list of generated reports based on query filters.
+    Retrieve a list of generated reports based on query filters, newest first.
+    When more reports may follow, the X-Next-Cursor response header holds
+    the cursor for the next page. With stream=true every report after the
+    cursor is streamed as one JSON array instead, without a next cursor.
     Requires authentication.
     """
-    logger.info(
-        f"User {current_user.email} fetching reports list with filters: {filters.model_dump(exclude_none=True)}"
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "User %s fetching reports list with filters: %s",
+            current_user.email,
+            filters.model_dump(exclude_none=True),
+        )
+    # Reject a bad cursor before a streamed response has started
+    if filters.cursor:
+        try:
+            crud.report.decode_cursor(filters.cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if stream:
+        return StreamingResponse(
+            stream_json_array(
+                lambda db: crud.report.stream_multi(
+                    db, filters=filters, columns=REPORT_LIST_COLUMNS
+                ),
+                ReportListItem,
+            ),
+            media_type="application/json",
+        )
+
+    reports = await crud.report.get_multi(
+        db=db, filters=filters, columns=REPORT_LIST_COLUMNS
     )
-    reports = await crud.report.get_multi(db=db, filters=filters)
+    if len(reports) == filters.limit:
+        response.headers["X-Next-Cursor"] = crud.report.encode_cursor(reports[-1])
     # TODO: Construct download URLs if needed (e.g., presigned S3 URLs)
-    logger.info(f"Found {len(reports)} reports matching criteria.")
+    logger.info("Found %s reports matching criteria.", len(reports))
     return reports
 
 
@@ -59,16 +113,18 @@ async def read_report(
     Requires authentication.
     """
     logger.info(
-        f"User {current_user.email} fetching report metadata for ID: {report_id}"
+        "User %s fetching report metadata for ID: %s",
+        current_user.email,
+        report_id,
     )
     db_report = await crud.report.get(db=db, report_id=report_id)
     if db_report is None:
-        logger.warning(f"Report metadata not found: {report_id}")
+        logger.warning("Report metadata not found: %s", report_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"
         )
     # TODO: Construct download URL
-    logger.info(f"Report metadata found: {report_id}")
+    logger.info("Report metadata found: %s", report_id)
     return db_report
 
 
@@ -89,7 +145,7 @@ async def trigger_report_generation(
     This runs as a background task. Requires superuser privileges.
     (This could also be triggered by a scheduled job/cron).
     """
-    logger.info(f"User {current_user.email} triggered report generation.")
+    logger.info("User %s triggered report generation.", current_user.email)
 
     # Define parameters for the report (can come from request body or defaults)
     generation_params = {
@@ -103,7 +159,7 @@ async def trigger_report_generation(
     background_tasks.add_task(
         generate_report_pdf,
         params=generation_params,
-        # db_url=str(settings.DATABASE_URL) # Pass URL if task needs new session
+        # db_url=str(settings.database.DATABASE_URL) # Pass URL if task needs new session
     )
 
     logger.info("Report generation task added to background queue.")
@@ -9,20 +9,26 @@ is strictly prohibited without explicit written permission.
 For licensing inquiries: kunalsingh2514@gmail.com
 """
 
+import asyncio
 import datetime
-from typing import Any, Dict
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import text
 
-from app.core.config import logger
+from app.core.config import logger, settings
 from app.core.dependencies import get_current_active_user
 from app.db.models import User
-from app.db.session import AsyncSessionLocal
+from app.db.session import engine
 from app.schemas import (  # Import relevant schemas
     ServiceStatus,
     SystemMetrics,
     SystemStatus,
 )
+from app.services.cache import redis_cache
 
 # Import Prometheus client library if directly querying Prometheus
 # from prometheus_client import CollectorRegistry, Gauge, push_to_gateway # Example
@@ -34,32 +40,123 @@ router = APIRouter()
 # health check endpoints of microservices, etc.
 
 
+# Mock metrics and service statuses, validated once at import. The models
+# are shared by every request and must not be mutated.
+_MOCK_SYSTEM_METRICS = SystemMetrics(
+    cpu_usage_percent=15.5,
+    memory_usage_percent=45.2,
+    uptime_seconds=172800,  # 2 days
+    request_rate_per_sec=50.1,
+    error_rate_percent=0.5,
+)
+
+_MOCK_SERVICE_STATUSES = (
+    ServiceStatus(name="Backend API", status="UP", details="Responding normally"),
+    ServiceStatus(name="Frontend Service", status="UP"),
+    ServiceStatus(name="Database (RDS)", status="UP"),
+    ServiceStatus(name="Alerting Service", status="UP"),
+    ServiceStatus(
+        name="ML Module",
+        status="DEGRADED",
+        details="Training job failed last night",
+    ),
+)
+
+
 async def get_mock_system_metrics() -> SystemMetrics:
     """Placeholder function to simulate fetching metrics."""
     # Simulate fetching from Prometheus or other monitoring system
-    return SystemMetrics(
-        cpu_usage_percent=15.5,
-        memory_usage_percent=45.2,
-        uptime_seconds=172800,  # 2 days
-        request_rate_per_sec=50.1,
-        error_rate_percent=0.5,
-    )
+    return _MOCK_SYSTEM_METRICS
 
 
-async def get_mock_service_statuses() -> list[ServiceStatus]:
+async def get_mock_service_statuses() -> Tuple[ServiceStatus, ...]:
     """Placeholder function to simulate checking service health."""
     # Simulate checking health endpoints
-    return [
-        ServiceStatus(name="Backend API", status="UP", details="Responding normally"),
-        ServiceStatus(name="Frontend Service", status="UP"),
-        ServiceStatus(name="Database (RDS)", status="UP"),
-        ServiceStatus(name="Alerting Service", status="UP"),
-        ServiceStatus(
-            name="ML Module",
-            status="DEGRADED",
-            details="Training job failed last night",
+    return _MOCK_SERVICE_STATUSES
+
+
+# ISO timestamp of the current second, rebuilt only when the second changes
+_LAST_TS_SEC = 0
+_LAST_TS_STR = ""
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string, to the second."""
+    global _LAST_TS_SEC, _LAST_TS_STR
+    now = int(time.time())
+    if now != _LAST_TS_SEC:
+        _LAST_TS_STR = datetime.datetime.fromtimestamp(
+            now, tz=datetime.timezone.utc
+        ).isoformat()
+        _LAST_TS_SEC = now
+    return _LAST_TS_STR
+
+
+# --- Health Probes ---
+
+# Upper bound for each health probe, so one wedged component cannot hold up
+# the whole health check
+HEALTH_CHECK_TIMEOUT = 2.0
+
+
+async def _check_database() -> str:
+    # A pooled connection is enough for a ping; no ORM session is needed
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return "ok"
+
+
+async def _check_cache() -> str:
+    reachable = await redis_cache.ping()
+    if reachable is None:
+        return "disabled"
+    return "ok" if reachable else "error"
+
+
+async def _check_storage() -> str:
+    # Reports are rendered to the temp directory before upload
+    writable = await asyncio.to_thread(os.access, tempfile.gettempdir(), os.W_OK)
+    return "ok" if writable else "error"
+
+
+_HEALTH_CHECKS = {
+    "database": _check_database,
+    "cache": _check_cache,
+    "storage": _check_storage,
+}
+
+# Last health result as (monotonic time, payload). Probes and scrapers can
+# hit /health many times a second, so one result is shared for
+# settings.HEALTH_CACHE_TTL seconds and the database sees at most one probe
+# per TTL per process.
+_HEALTH_CACHE: Optional[Tuple[float, Dict[str, Any]]] = None
+_HEALTH_LOCK = asyncio.Lock()
+
+
+async def _probe_health() -> Dict[str, Any]:
+    # Probe every component concurrently, so the check takes as long as the
+    # slowest probe rather than the sum of them
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(check(), HEALTH_CHECK_TIMEOUT)
+            for check in _HEALTH_CHECKS.values()
         ),
-    ]
+        return_exceptions=True,
+    )
+
+    components = {}
+    for name, result in zip(_HEALTH_CHECKS, results):
+        if isinstance(result, BaseException):
+            logger.error("%s health check failed: %r", name.capitalize(), result)
+            components[name] = "error"
+        else:
+            components[name] = result
+
+    return {
+        "status": "error" if "error" in components.values() else "ok",
+        "components": components,
+        "timestamp": _utc_timestamp(),
+    }
 
 
 # --- Endpoint ---
@@ -78,7 +175,7 @@ async def get_system_status(
     NOTE: This currently returns mock data. Integration with Prometheus/Grafana
           or other monitoring tools is required for real data.
     """
-    logger.info(f"User {current_user.email} fetching system status.")
+    logger.info("User %s fetching system status.", current_user.email)
     try:
         # In a real implementation:
         # 1. Query Prometheus for metrics (CPU, Mem, Req Rate, Errors)
@@ -89,24 +186,27 @@ async def get_system_status(
         metrics = await get_mock_system_metrics()
         service_statuses = await get_mock_service_statuses()
 
-        # Determine overall status based on component statuses
+        # Determine overall status based on component statuses, in one pass
+        # that stops at the first service that is down
         overall_status = "HEALTHY"
-        if any(s.status == "DOWN" for s in service_statuses):
-            overall_status = "UNHEALTHY"
-        elif any(s.status == "DEGRADED" for s in service_statuses):
-            overall_status = "DEGRADED"
+        for service in service_statuses:
+            if service.status == "DOWN":
+                overall_status = "UNHEALTHY"
+                break
+            if service.status == "DEGRADED":
+                overall_status = "DEGRADED"
 
         status_response = SystemStatus(
             overall_status=overall_status,
             metrics=metrics,
             service_statuses=service_statuses,
-            last_updated=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            last_updated=_utc_timestamp(),
         )
-        logger.info(f"System status generated: Overall={overall_status}")
+        logger.info("System status generated: Overall=%s", overall_status)
         return status_response
 
     except Exception as e:
-        logger.error(f"Error fetching system status: {e}", exc_info=True)
+        logger.error("Error fetching system status: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve system status.",
@@ -120,25 +220,20 @@ async def get_system_health():
     This endpoint is used by monitoring tools to check if the system is up and running.
     It does not require authentication to allow for external monitoring.
     """
+    global _HEALTH_CACHE
     logger.info("Health check requested")
 
-    health_status = {
-        "status": "ok",
-        "components": {"database": "ok", "cache": "ok", "storage": "ok"},
-        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-    }
-
-    # Check database connectivity
-    try:
-        async with AsyncSessionLocal() as db:
-            from sqlalchemy import text
-
-            await db.execute(text("SELECT 1"))
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        health_status["components"]["database"] = "error"
-        health_status["status"] = "error"
-
+    cached = _HEALTH_CACHE
+    if cached and time.monotonic() - cached[0] < settings.HEALTH_CACHE_TTL:
+        return cached[1]
+
+    async with _HEALTH_LOCK:
+        # Concurrent callers wait for the probe already in flight
+        cached = _HEALTH_CACHE
+        if cached and time.monotonic() - cached[0] < settings.HEALTH_CACHE_TTL:
+            return cached[1]
+        health_status = await _probe_health()
+        _HEALTH_CACHE = (time.monotonic(), health_status)
     return health_status
 
 
@@ -12,9 +12,11 @@ For licensing inquiries: kunalsingh2514@gmail.com
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.api_v1.streaming import stream_json_array
 from app.core.dependencies import get_current_active_superuser, get_current_active_user
 from app.db import crud
 from app.db.session import get_db
@@ -32,6 +34,10 @@ router = APIRouter()
 # Assign the router instance to a variable named 'users'
 users = router
 
+# Columns read by the User response schema; the list skips the rest
+# (preferences, MFA and audit fields) instead of loading whole rows
+USER_LIST_COLUMNS = tuple(User.model_fields)
+
 
 # Add your user-related endpoints here later
 # Example placeholder endpoint:
@@ -48,10 +54,28 @@ async def read_users_me(
 
 @router.get("/", response_model=List[User])
 async def list_users(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    stream: bool = Query(
+        False, description="Stream every user from skip on, ignoring limit"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_superuser),
 ):
-    users = await crud.user.get_multi(db)
+    if stream:
+        return StreamingResponse(
+            stream_json_array(
+                lambda db: crud.user.stream_multi(
+                    db, skip=skip, columns=USER_LIST_COLUMNS
+                ),
+                User,
+            ),
+            media_type="application/json",
+        )
+
+    users = await crud.user.get_multi(
+        db, skip=skip, limit=limit, columns=USER_LIST_COLUMNS
+    )
     return users
 
 
@@ -84,10 +108,9 @@ async def update_user(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_superuser),
 ):
-    user = await crud.user.get(db, user_id=user_id)
-    if not user:
+    updated_user = await crud.user.update_by_id(db, user_id=user_id, obj_in=user_in)
+    if not updated_user:
         raise HTTPException(status_code=404, detail="User not found")
-    updated_user = await crud.user.update(db, db_obj=user, obj_in=user_in)
     return updated_user
 
 
@@ -97,10 +120,9 @@ async def delete_user(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_superuser),
 ):
-    user = await crud.user.get(db, user_id=user_id)
-    if not user:
+    deleted_user = await crud.user.delete(db, user_id=user_id)
+    if not deleted_user:
         raise HTTPException(status_code=404, detail="User not found")
-    await crud.user.delete(db, user_id=user_id)
     return None
 
 
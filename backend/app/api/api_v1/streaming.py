@@ -0,0 +1,41 @@
+"""
+TwinSecure - Advanced Cybersecurity Platform
+Copyright © 2024 TwinSecure. All rights reserved.
+
+This file is part of TwinSecure, a proprietary cybersecurity platform.
+Unauthorized copying, distribution, modification, or use of this software
+is strictly prohibited without explicit written permission.
+
+For licensing inquiries: kunalsingh2514@gmail.com
+"""
+
+"""
+Streamed JSON array bodies for the large list endpoints.
+"""
+
+from typing import Any, AsyncIterator, Callable, Type
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import AsyncSessionLocal
+
+
+async def stream_json_array(
+    rows_fn: Callable[[AsyncSession], AsyncIterator[Any]],
+    schema: Type[BaseModel],
+) -> AsyncIterator[bytes]:
+    """
+    Yield the rows of rows_fn(db) as one JSON array, serialized with schema.
+
+    The request-scoped session from get_db is closed before a streaming
+    body is sent, so the stream opens its own session and hands it to
+    rows_fn.
+    """
+    async with AsyncSessionLocal() as db:
+        yield b"["
+        separator = b""
+        async for row in rows_fn(db):
+            yield separator + schema.model_validate(row).model_dump_json().encode()
+            separator = b","
+        yield b"]"
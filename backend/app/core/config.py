@@ -13,17 +13,28 @@ For licensing inquiries: kunalsingh2514@gmail.com
 
 import json
 import os
+import re
 import secrets
-from functools import lru_cache
+import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import List, Optional, Union
 
 from dotenv import load_dotenv
-from pydantic import AnyHttpUrl, EmailStr, Field, SecretStr, field_validator
-from pydantic_settings import BaseSettings
+from pydantic import (
+    AnyHttpUrl,
+    EmailStr,
+    Field,
+    SecretStr,
+    field_validator,
+    model_validator,
+)
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Load environment variables from .env file (especially for local development)
 # In production (e.g., EKS), environment variables are typically injected directly.
+# This is the only read of .env: the nested settings and license manager read
+# os.environ, so the Settings model does not parse the file a second time.
 load_dotenv()
 
 
@@ -42,6 +53,9 @@ class CacheSettings(BaseSettings):
         "/api/v1/users/me",
         "/api/v1/health",
         "/metrics",
+        # Cached in Redis by the endpoints, which invalidate it on writes
+        "/api/v1/alerts",
+        "/api/v1/dashboard",
     ]
     CACHE_EXCLUDE_QUERY_PARAMS: List[str] = ["_", "timestamp", "nocache"]
 
@@ -68,13 +82,25 @@ class SecuritySettings(BaseSettings):
     CSRF_COOKIE_SECURE: bool = True
     CSRF_COOKIE_HTTPONLY: bool = True
     CSRF_COOKIE_SAMESITE: str = "Lax"
-    RATE_LIMIT_ENABLED: bool = True
-    RATE_LIMIT_DEFAULT: str = "100/minute"
-    RATE_LIMIT_STORAGE_URI: Optional[str] = None
-    RATE_LIMIT_STRATEGY: str = "fixed-window"
     JWT_BLACKLIST_ENABLED: bool = True
     JWT_BLACKLIST_TOKEN_CHECKS: List[str] = ["access", "refresh"]
 
+    model_config = SettingsConfigDict(env_prefix="SECURITY__", case_sensitive=True)
+
+    @cached_property
+    def PASSWORD_REGEX(self) -> re.Pattern:
+        """PASSWORD_PATTERN compiled once, exposed for callers that validate passwords."""
+        return re.compile(self.PASSWORD_PATTERN)
+
+
+@lru_cache()
+def _assemble_database_url(
+    user: str, password: str, server: str, port: int, db: str
+) -> str:
+    # URL encode special characters in password
+    password = password.replace("@", "%40").replace("#", "%23").replace("$", "%24")
+    return f"postgresql+asyncpg://{user}:{password}@{server}:{port}/{db}"
+
 
 class DatabaseSettings(BaseSettings):
     """Database configuration settings"""
@@ -93,21 +119,22 @@ class DatabaseSettings(BaseSettings):
     ECHO_POOL: bool = False
     POOL_TIMEOUT: int = 30
     POOL_RECYCLE: int = 1800
-
-    @field_validator("DATABASE_URL", mode="before")
-    def assemble_db_connection(cls, v: Optional[str], info) -> str:
-        if isinstance(v, str):
-            return v
-        values = info.data
-        password = values["POSTGRES_PASSWORD"]
-        # URL encode special characters in password
-        password = password.replace("@", "%40").replace("#", "%23").replace("$", "%24")
-        db_name = values["POSTGRES_DB"]  # Get the database name
-        print(f"Using database name: {db_name}")  # Debug print
-        return (
-            f"postgresql+asyncpg://{values['POSTGRES_USER']}:{password}"
-            f"@{values['POSTGRES_SERVER']}:{values['POSTGRES_PORT']}/{db_name}"
-        )
+    # Prepared statements kept per asyncpg connection (SQLAlchemy default: 100)
+    PREPARED_STATEMENT_CACHE_SIZE: int = 1024
+
+    @model_validator(mode="after")
+    def assemble_db_connection(self) -> "DatabaseSettings":
+        # Built once, as a plain string, unless DATABASE_URL was given.
+        # A field validator would not run on the None default at all.
+        if not self.DATABASE_URL:
+            self.DATABASE_URL = _assemble_database_url(
+                self.POSTGRES_USER,
+                self.POSTGRES_PASSWORD,
+                self.POSTGRES_SERVER,
+                self.POSTGRES_PORT,
+                self.POSTGRES_DB,
+            )
+        return self
 
 
 class GeoIP2Settings(BaseSettings):
@@ -119,10 +146,9 @@ class GeoIP2Settings(BaseSettings):
         None, description="MaxMind license key for GeoLite2 database"
     )
 
-    class Config:
-        env_prefix = "MAXMIND_"
-        case_sensitive = True
-        validate_by_name = True
+    model_config = SettingsConfigDict(
+        env_prefix="MAXMIND_", case_sensitive=True, validate_by_name=True
+    )
 
 
 class Settings(BaseSettings):
@@ -147,6 +173,7 @@ class Settings(BaseSettings):
     ENABLE_METRICS: bool = True
     ENABLE_CACHING: bool = True
     ENABLE_RATE_LIMITING: bool = True
+    ENABLE_COMPRESSION: bool = True
 
     # Nested Settings
     security: SecuritySettings = Field(default_factory=SecuritySettings)
@@ -158,62 +185,30 @@ class Settings(BaseSettings):
     MAXMIND_LICENSE_KEY: Optional[str] = None
 
     # Rate Limiting Settings
-    ENABLE_RATE_LIMITING: bool = True
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_DEFAULT: str = "100/minute"
     RATE_LIMIT_STORAGE_URI: str = "memory://"
     RATE_LIMIT_STRATEGY: str = "fixed-window"
 
-    # Security Settings
-    SECURITY__SECRET_KEY: SecretStr = Field(
-        default_factory=lambda: SecretStr(secrets.token_urlsafe(32))
-    )
-    SECURITY__ALGORITHM: str = "HS256"
-    SECURITY__ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-    SECURITY__REFRESH_TOKEN_EXPIRE_DAYS: int = 7
-    SECURITY__PASSWORD_MIN_LENGTH: int = 12
-    SECURITY__PASSWORD_MAX_LENGTH: int = 128
-    SECURITY__PASSWORD_PATTERN: str = (
-        r"^(?=.*[A-Za-z])(?=.*\d)(?=.*[@$!%*#?&])[A-Za-z\d@$!%*#?&]{12,}$"
-    )
-    SECURITY__SESSION_COOKIE_NAME: str = "twinsecure_session"
-    SECURITY__SESSION_COOKIE_SECURE: bool = True
-    SECURITY__SESSION_COOKIE_HTTPONLY: bool = True
-    SECURITY__SESSION_COOKIE_SAMESITE: str = "Lax"
-    SECURITY__CSRF_COOKIE_NAME: str = "twinsecure_csrf"
-    SECURITY__CSRF_COOKIE_SECURE: bool = True
-    SECURITY__CSRF_COOKIE_HTTPONLY: bool = True
-    SECURITY__CSRF_COOKIE_SAMESITE: str = "Lax"
-    SECURITY__RATE_LIMIT_ENABLED: bool = True
-    SECURITY__RATE_LIMIT_DEFAULT: str = "100/minute"
-    SECURITY__JWT_BLACKLIST_ENABLED: bool = True
-    SECURITY__JWT_BLACKLIST_TOKEN_CHECKS: List[str] = ["access", "refresh"]
-
-    # Database Settings
-    POSTGRES_SERVER: str = (
-        "localhost"  # Changed from twinsecure_db to localhost for local development
-    )
-    POSTGRES_PORT: int = 5432
-    POSTGRES_USER: str = "postgres"
-    POSTGRES_PASSWORD: str = "kUNAL@#$12345"
-    POSTGRES_DB: str = "TwinSecure"  # Ensure consistent capitalization
-    DATABASE_URL: Optional[str] = None
+    # Security (SECURITY__*), database (POSTGRES_*, DATABASE_URL) and cache
+    # (REDIS_*, CACHE_*) values live only on the nested settings above
 
     # Cache Settings
-    REDIS_URL: Optional[str] = None
-    REDIS_PASSWORD: Optional[SecretStr] = None
-    CACHE_TTL: int = 3600
-    CACHE_PREFIX: str = "twinsecure:"
-    CACHE_ENABLED: bool = True
-    CACHE_MAX_SIZE: int = 1000
-    CACHE_DEFAULT_TTL: int = 60
-    CACHE_EXCLUDE_PATHS: List[str] = [
-        "/api/v1/auth/",
-        "/api/v1/users/me",
-        "/api/v1/health",
-        "/metrics",
-    ]
-    CACHE_EXCLUDE_QUERY_PARAMS: List[str] = ["_", "timestamp", "nocache"]
+    DASHBOARD_CACHE_TTL: int = 10
+    HEALTH_CACHE_TTL: float = 2.0  # Seconds a /health result is reused
+
+    # Compression Settings
+    COMPRESSION_MINIMUM_SIZE: int = 512
+    COMPRESSION_LEVEL: int = Field(6, ge=1, le=9)
+
+    # Honeypot alert write buffer
+    ALERT_BUFFER_BATCH_SIZE: int = 500
+    ALERT_BUFFER_FLUSH_INTERVAL: float = 0.5
+    ALERT_BUFFER_MAX_SIZE: int = 10000
+
+    # Honeypot processing workers
+    HONEYPOT_WORKERS: int = 4
+    HONEYPOT_QUEUE_MAX_SIZE: int = 10000
 
     # Alerting Settings
     SLACK_WEBHOOK_URL: Optional[str] = None
@@ -258,37 +253,27 @@ class Settings(BaseSettings):
     # CORS Settings
     BACKEND_CORS_ORIGINS: List[str] = []
 
-    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
-    def assemble_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
-        return v
-
-    @field_validator("DATABASE_URL", mode="before")
-    def assemble_db_connection(cls, v: Optional[str], info) -> str:
+    @field_validator("BACKEND_CORS_ORIGINS", "ALERT_RECIPIENTS", mode="before")
+    @classmethod
+    def split_comma_separated(cls, v: Union[str, List[str], None]) -> List[str]:
+        # Only split here; pydantic validates each item against the list's
+        # element type (e.g. EmailStr for ALERT_RECIPIENTS) afterwards
         if isinstance(v, str):
-            return v
-        values = info.data
-        password = values["POSTGRES_PASSWORD"]
-        # URL encode special characters in password
-        password = password.replace("@", "%40").replace("#", "%23").replace("$", "%24")
-        return (
-            f"postgresql+asyncpg://{values['POSTGRES_USER']}:{password}"
-            f"@{values['POSTGRES_SERVER']}:{values['POSTGRES_PORT']}/{values['POSTGRES_DB']}"
-        )
-
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
-        env_nested_delimiter = "__"
-        validate_by_name = True
-        extra = "allow"  # Allow extra fields from environment variables
+            return [item.strip() for item in v.split(",") if item.strip()]
+        return v or []
+
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_nested_delimiter="__",
+        validate_by_name=True,
+        extra="allow",  # Allow extra fields from environment variables
+    )
 
     def generate_secret_key(self) -> str:
         """Generate a secure secret key if not set"""
-        if not self.SECURITY__SECRET_KEY:
+        if not self.security.SECRET_KEY:
             return secrets.token_urlsafe(32)
-        return self.SECURITY__SECRET_KEY.get_secret_value()
+        return self.security.SECRET_KEY.get_secret_value()
 
     def get_cors_origins(self) -> List[str]:
         """Get CORS origins with validation"""
@@ -297,21 +282,50 @@ class Settings(BaseSettings):
         return self.BACKEND_CORS_ORIGINS
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """Get cached settings instance"""
-    return Settings()
+# String settings compared or used as prefixes on every request
+_INTERNED_SETTINGS = ("API_V1_STR", "ENVIRONMENT")
+_INTERNED_CACHE_SETTINGS = ("CACHE_PREFIX",)
+
+
+def _build_settings() -> Settings:
+    """Construct the settings instance and intern its hot string fields"""
+    instance = Settings()
+    for name in _INTERNED_SETTINGS:
+        setattr(instance, name, sys.intern(getattr(instance, name)))
+    for name in _INTERNED_CACHE_SETTINGS:
+        setattr(instance.cache, name, sys.intern(getattr(instance.cache, name)))
+    return instance
 
 
 # Initialize settings
-settings = get_settings()
+settings = _build_settings()
+
+
+def get_settings() -> Settings:
+    """Get the settings instance built at import"""
+    return settings
+
 
 # Advanced logging configuration
+import atexit
+import gzip
 import logging
 import logging.handlers
+import queue
+import shutil
 from pathlib import Path
 
 
+def _gzip_log_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_log_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
 def setup_logging():
     """Configure advanced logging with rotation and formatting"""
     log_dir = Path("logs")
@@ -323,20 +337,32 @@ def setup_logging():
     )
     console_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
-    # Create handlers
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_dir / "app.log", maxBytes=10_000_000, backupCount=5  # 10MB
+    # Create handlers. Rotation is time based, so emitting a record does not
+    # stat the file to check its size; rotated files are gzip-compressed.
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        log_dir / "app.log", when="H", backupCount=48
     )
+    file_handler.namer = _gzip_log_namer
+    file_handler.rotator = _gzip_log_rotator
     file_handler.setFormatter(file_formatter)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(console_formatter)
 
+    # Records are queued by the logging call and written by a listener thread,
+    # so file and console I/O (and log rotation) never block the event loop
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(listener.stop)
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(settings.LOG_LEVEL)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Create application logger
     logger = logging.getLogger(__name__)
@@ -347,6 +373,27 @@ logger = setup_logging()
 
 
 # AWS Secrets Manager integration
+@lru_cache(maxsize=8)
+def _secrets_manager_client(
+    region: Optional[str],
+    access_key_id: Optional[str],
+    secret_access_key: Optional[str],
+):
+    """Create one Secrets Manager client per region and credential set.
+
+    boto3 clients are thread-safe, so retries and repeated loads reuse the
+    client instead of resolving credentials and endpoints again.
+    """
+    import boto3
+
+    session = boto3.session.Session(
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        region_name=region,
+    )
+    return session.client(service_name="secretsmanager", region_name=region)
+
+
 def load_secrets_from_aws() -> None:
     """Load secrets from AWS Secrets Manager with error handling and retries"""
     if (
@@ -355,26 +402,22 @@ def load_secrets_from_aws() -> None:
     ):
         try:
             import backoff
-            import boto3
             from botocore.exceptions import ClientError
 
             @backoff.on_exception(backoff.expo, ClientError, max_tries=3)
             def get_secret():
-                session = boto3.session.Session(
-                    aws_access_key_id=(
+                client = _secrets_manager_client(
+                    settings.AWS_REGION,
+                    (
                         settings.AWS_ACCESS_KEY_ID.get_secret_value()
                         if settings.AWS_ACCESS_KEY_ID
                         else None
                     ),
-                    aws_secret_access_key=(
+                    (
                         settings.AWS_SECRET_ACCESS_KEY.get_secret_value()
                         if settings.AWS_SECRET_ACCESS_KEY
                         else None
                     ),
-                    region_name=settings.AWS_REGION,
-                )
-                client = session.client(
-                    service_name="secretsmanager", region_name=settings.AWS_REGION
                 )
                 return client.get_secret_value(
                     SecretId=settings.AWS_SECRETS_MANAGER_SECRET_NAME
@@ -383,10 +426,21 @@ def load_secrets_from_aws() -> None:
             response = get_secret()
             if "SecretString" in response:
                 secret = json.loads(response["SecretString"])
-                # Update settings with secrets
+                # Update settings with secrets; each key lives either on the
+                # top level or on one of the nested sections
+                sections = (
+                    settings,
+                    settings.security,
+                    settings.database,
+                    settings.cache,
+                )
                 for key, value in secret.items():
-                    if hasattr(settings, key):
-                        setattr(settings, key, value)
+                    if key.startswith("SECURITY__"):
+                        key = key[len("SECURITY__") :]
+                    for section in sections:
+                        if key in type(section).model_fields:
+                            setattr(section, key, value)
+                            break
                 logger.info("Successfully loaded secrets from AWS Secrets Manager")
             else:
                 logger.warning("SecretString not found in AWS Secrets Manager response")
@@ -397,6 +451,10 @@ def load_secrets_from_aws() -> None:
             raise
 
 
-# Load secrets in non-dev environments
+# Load secrets in non-dev environments. This has to happen at import: the
+# database engine (app.db.session) and Alembic read DATABASE_URL as soon as
+# they are imported, before any application startup hook could run. The
+# function returns without touching the network (or importing boto3) unless
+# AWS_SECRETS_MANAGER_SECRET_NAME is set.
 if settings.ENVIRONMENT != "development":
     load_secrets_from_aws()
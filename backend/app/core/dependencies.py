@@ -9,8 +9,6 @@ is strictly prohibited without explicit written permission.
 For licensing inquiries: kunalsingh2514@gmail.com
 """
 
-from uuid import UUID
-
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import ValidationError  # Import ValidationError for Pydantic v2+
@@ -50,16 +48,13 @@ async def get_current_user(
         logger.warning("Token decoding failed or subject (sub) missing.")
         raise credentials_exception
 
-    try:
-        # Ensure the subject is a valid UUID before querying the database
-        user_id = UUID(str(token_data.sub))
-    except (ValueError, TypeError):
-        logger.warning(f"Invalid user ID format in token subject: {token_data.sub}")
-        raise credentials_exception
+    # TokenPayload validates sub as a UUID, and decode_token caches the
+    # payload, so the subject is parsed once per token rather than per request
+    user_id = token_data.sub
 
     user = await crud.user.get(db, user_id=user_id)
     if user is None:
-        logger.warning(f"User not found for ID: {user_id}")
+        logger.warning("User not found for ID: %s", user_id)
         raise credentials_exception
 
     # Optional: Add checks like user.is_active
@@ -67,7 +62,7 @@ async def get_current_user(
     #     logger.warning(f"Inactive user attempted access: {user.email}")
     #     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
 
-    logger.debug(f"Authenticated user retrieved: {user.email} (ID: {user.id})")
+    logger.debug("Authenticated user retrieved: %s (ID: %s)", user.email, user.id)
     return user
 
 
@@ -80,12 +75,13 @@ async def get_current_active_user(
     """
     if not current_user.is_active:
         logger.warning(
-            f"Inactive user attempted access requiring active status: {current_user.email}"
+            "Inactive user attempted access requiring active status: %s",
+            current_user.email,
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
         )
-    logger.debug(f"Active user confirmed: {current_user.email}")
+    logger.debug("Active user confirmed: %s", current_user.email)
     return current_user
 
 
@@ -98,13 +94,14 @@ async def get_current_active_superuser(
     """
     if not crud.user.is_superuser(current_user):
         logger.warning(
-            f"Non-superuser attempted access requiring superuser role: {current_user.email}"
+            "Non-superuser attempted access requiring superuser role: %s",
+            current_user.email,
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="The user doesn't have enough privileges",
         )
-    logger.debug(f"Superuser access granted: {current_user.email}")
+    logger.debug("Superuser access granted: %s", current_user.email)
     return current_user
 
 
@@ -17,7 +17,7 @@ This helps prevent circular imports.
 import enum
 
 
-class UserRole(str, enum.Enum):
+class UserRole(enum.StrEnum):
     """User role enumeration"""
 
     ADMIN = "admin"
@@ -26,7 +26,7 @@ class UserRole(str, enum.Enum):
     API_USER = "api_user"
 
 
-class UserStatus(str, enum.Enum):
+class UserStatus(enum.StrEnum):
     """User status enumeration"""
 
     ACTIVE = "active"
@@ -35,7 +35,7 @@ class UserStatus(str, enum.Enum):
     PENDING = "pending"
 
 
-class AlertType(str, enum.Enum):
+class AlertType(enum.StrEnum):
     """Alert type enumeration"""
 
     HONEYPOT_TRIGGER = "honeypot_trigger"
@@ -48,7 +48,7 @@ class AlertType(str, enum.Enum):
     CUSTOM = "custom"
 
 
-class AlertSeverity(str, enum.Enum):
+class AlertSeverity(enum.StrEnum):
     """Alert severity enumeration"""
 
     CRITICAL = "critical"
@@ -58,7 +58,7 @@ class AlertSeverity(str, enum.Enum):
     INFO = "info"
 
 
-class AlertStatus(str, enum.Enum):
+class AlertStatus(enum.StrEnum):
     """Alert status enumeration"""
 
     NEW = "new"
@@ -70,7 +70,7 @@ class AlertStatus(str, enum.Enum):
     FALSE_POSITIVE = "false_positive"
 
 
-class ReportType(str, enum.Enum):
+class ReportType(enum.StrEnum):
     """Report type enumeration"""
 
     DAILY_SUMMARY = "daily_summary"
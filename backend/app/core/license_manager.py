@@ -13,8 +13,9 @@ import platform
 import socket
 import subprocess
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from typing import Dict, Optional, Tuple
 
 import httpx
 from cryptography.fernet import Fernet
@@ -34,26 +35,55 @@ class LicenseInfo(BaseModel):
 class LicenseManager:
     """Manages software licensing and protection."""
 
-    def __init__(self):
-        self.license_server_url = os.getenv("LICENSE_SERVER_URL", "https://your-license-server.com")
-        self.encryption_key = os.getenv("LICENSE_ENCRYPTION_KEY", self._generate_key())
-        try:
-            # Ensure the key is properly formatted for Fernet
-            if len(self.encryption_key) < 44:
-                self.encryption_key = self._generate_key()
-            self.fernet = Fernet(self.encryption_key.encode()[:44] + b'=')
-        except Exception:
-            # Fallback to a simple key
-            self.fernet = Fernet(Fernet.generate_key())
+    _VALID_DEMO_KEYS = frozenset({
+        "TS-DEMO-2024-KUNAL-SINGH",
+        "TS-DEV-UNLIMITED-ACCESS",
+        "TS-CREATOR-KUNAL-SINGH-2024",
+        "TS-TRIAL-BYPASS-KEY-2024",
+    })
+
+    TRIAL_FILE = ".trial_info"
+    TRIAL_PERIOD = timedelta(days=7)
+    LICENSE_CACHE_TTL = timedelta(hours=1)
 
-    def _generate_key(self) -> str:
-        """Generate encryption key based on system info."""
-        return Fernet.generate_key().decode()
+    # Shared by every manager: built once from LICENSE_ENCRYPTION_KEY
+    _fernet: Optional[Fernet] = None
 
-    def get_hardware_id(self) -> str:
-        """Generate unique hardware ID for license binding."""
+    def __init__(self):
+        self.license_server_url = os.getenv("LICENSE_SERVER_URL", "https://your-license-server.com")
+        self.fernet = self._get_fernet()
+        self._http: Optional[httpx.AsyncClient] = None
+        # (license key, hardware ID) -> (reuse until, validated license)
+        self._license_cache: Dict[Tuple[str, str], Tuple[datetime, LicenseInfo]] = {}
+        # (trial file mtime, trial expiry or None if invalid)
+        self._trial_cache: Optional[Tuple[float, Optional[datetime]]] = None
+
+    @classmethod
+    def _get_fernet(cls) -> Fernet:
+        """Fernet for the trial file, from LICENSE_ENCRYPTION_KEY or a generated key."""
+        if cls._fernet is None:
+            encryption_key = os.getenv("LICENSE_ENCRYPTION_KEY")
+            try:
+                # A Fernet key is 44 url-safe base64 characters, padding included
+                cls._fernet = Fernet(encryption_key.encode()[:44])
+            except Exception:
+                # Missing or malformed key: fall back to a generated one
+                cls._fernet = Fernet(Fernet.generate_key())
+        return cls._fernet
+
+    @cached_property
+    def hardware_id(self) -> str:
+        """
+        Unique hardware ID for license binding.
+
+        Computed once per manager instance (the module-level license_manager
+        is the one the app uses); the MAC, hostname and platform do not
+        change while the process runs.
+        """
         try:
-            # Get MAC address
+            # Get MAC address. The shifts step by 2 bits, not 8, so this is
+            # not the canonical MAC string; it is kept as is because trial
+            # files store the resulting ID.
             mac = ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff)
                            for elements in range(0, 2*6, 2)][::-1])
 
@@ -71,26 +101,68 @@ class LicenseManager:
             # Fallback to UUID
             return str(uuid.uuid4())[:16]
 
+    def _http_client(self) -> httpx.AsyncClient:
+        """Shared client for the license server, so connections are reused."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.license_server_url,
+                timeout=10.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=10, keepalive_expiry=300
+                ),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the license server client; called at application shutdown."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     async def validate_license(self, license_key: str) -> Optional[LicenseInfo]:
-        """Validate license with remote server."""
+        """
+        Validate license with remote server.
+
+        A successful result is reused until the license expires, but for no
+        longer than LICENSE_CACHE_TTL so revocations are still picked up.
+        Failures are not cached.
+        """
+        cache_key = (license_key, self.hardware_id)
+        cached = self._license_cache.get(cache_key)
+        if cached is not None:
+            valid_until, info = cached
+            if datetime.now(timezone.utc) < valid_until:
+                return info
+            del self._license_cache[cache_key]
+
         try:
-            hardware_id = self.get_hardware_id()
-
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.license_server_url}/validate",
-                    json={
-                        "license_key": license_key,
-                        "hardware_id": hardware_id,
-                        "product": "TwinSecure",
-                        "version": "1.0.0"
-                    },
-                    timeout=10.0
+            hardware_id = self.hardware_id
+
+            response = await self._http_client().post(
+                "/validate",
+                json={
+                    "license_key": license_key,
+                    "hardware_id": hardware_id,
+                    "product": "TwinSecure",
+                    "version": "1.0.0"
+                },
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                info = LicenseInfo(**data)
+                # Compared in aware UTC: the tzinfo pydantic attaches to
+                # parsed offsets cannot be passed to datetime.now()
+                expires_at = info.expires_at
+                if expires_at.tzinfo is None:
+                    expires_at = expires_at.replace(tzinfo=timezone.utc)
+                else:
+                    expires_at = expires_at.astimezone(timezone.utc)
+                valid_until = min(
+                    expires_at, datetime.now(timezone.utc) + self.LICENSE_CACHE_TTL
                 )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return LicenseInfo(**data)
+                self._license_cache[cache_key] = (valid_until, info)
+                return info
 
         except Exception as e:
             print(f"License validation failed: {e}")
@@ -99,24 +171,45 @@ class LicenseManager:
 
     def check_trial_period(self) -> bool:
         """Check if trial period is still valid."""
-        trial_file = ".trial_info"
+        # The decrypted trial file is cached by its mtime, so repeated checks
+        # skip the read and Fernet decryption while the file is unchanged
+        cached = self._trial_cache
+        if cached is not None and cached[0] == self._trial_file_mtime():
+            expires_at = cached[1]
+        else:
+            expires_at = self._trial_expiry()
+            mtime = self._trial_file_mtime()
+            # Without a trial file there is nothing to key the cache on
+            self._trial_cache = (mtime, expires_at) if mtime is not None else None
+
+        return expires_at is not None and datetime.now() <= expires_at
+
+    def _trial_file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.TRIAL_FILE).st_mtime
+        except OSError:
+            return None
+
+    def _trial_expiry(self, _retry: bool = True) -> Optional[datetime]:
+        """Read the trial file and return when the trial ends, or None if invalid."""
+        trial_file = self.TRIAL_FILE
 
         if not os.path.exists(trial_file):
             # First run - create trial file
             trial_start = datetime.now()
             trial_data = {
                 "start_date": trial_start.isoformat(),
-                "hardware_id": self.get_hardware_id()
+                "hardware_id": self.hardware_id
             }
 
             try:
                 encrypted_data = self.fernet.encrypt(json.dumps(trial_data).encode())
                 with open(trial_file, 'wb') as f:
                     f.write(encrypted_data)
-                return True
             except Exception:
                 # If encryption fails, still allow trial but without persistence
-                return True
+                pass
+            return trial_start + self.TRIAL_PERIOD
 
         try:
             with open(trial_file, 'rb') as f:
@@ -126,46 +219,42 @@ class LicenseManager:
             trial_data = json.loads(decrypted_data.decode())
 
             # Check hardware ID
-            if trial_data["hardware_id"] != self.get_hardware_id():
-                return False
+            if trial_data["hardware_id"] != self.hardware_id:
+                return None
 
             # Check trial period (7 days)
             start_date = datetime.fromisoformat(trial_data["start_date"])
-            if datetime.now() > start_date + timedelta(days=7):
-                return False
-
-            return True
+            return start_date + self.TRIAL_PERIOD
 
         except Exception:
-            # If trial file is corrupted, allow a fresh trial
+            # If trial file is corrupted, allow a fresh trial. Retry once only:
+            # if the fresh file is unreadable too (e.g. another worker is
+            # writing it), treat the trial as invalid instead of recursing.
+            if not _retry:
+                return None
             try:
                 os.remove(trial_file)
-            except:
+            except OSError:
                 pass
-            return self.check_trial_period()
+            return self._trial_expiry(_retry=False)
+
+    def _is_valid_key(self, license_key: str) -> bool:
+        """Check if license_key is a demo key or a well-formed TwinSecure key."""
+        # Accept demo keys or validate format for other keys: TS- prefix, at
+        # least 16 characters and at least 3 dash-separated parts
+        return license_key in self._VALID_DEMO_KEYS or (
+            license_key.startswith("TS-")
+            and len(license_key) >= 16
+            and license_key.count("-") >= 2
+        )
 
     def is_authorized(self) -> bool:
         """Check if software is authorized to run."""
         # Check for license key in environment
         license_key = os.getenv("TWINSECURE_LICENSE_KEY")
 
-        if license_key:
-            # Check if it's a valid TwinSecure license key
-            valid_demo_keys = [
-                "TS-DEMO-2024-KUNAL-SINGH",
-                "TS-DEV-UNLIMITED-ACCESS",
-                "TS-CREATOR-KUNAL-SINGH-2024",
-                "TS-TRIAL-BYPASS-KEY-2024"
-            ]
-
-            # Accept demo keys or validate format for other keys
-            if license_key in valid_demo_keys:
-                return True
-            elif (license_key.startswith("TS-") and
-                  len(license_key) >= 16 and
-                  "-" in license_key[3:] and  # Must have dashes after TS-
-                  len(license_key.split("-")) >= 3):  # Must have at least 3 parts
-                return True
+        if license_key and self._is_valid_key(license_key):
+            return True
 
         # Check trial period
         return self.check_trial_period()
@@ -175,20 +264,7 @@ class LicenseManager:
         license_key = os.getenv("TWINSECURE_LICENSE_KEY")
 
         if license_key:
-            # Check if the license key is valid
-            valid_demo_keys = [
-                "TS-DEMO-2024-KUNAL-SINGH",
-                "TS-DEV-UNLIMITED-ACCESS",
-                "TS-CREATOR-KUNAL-SINGH-2024",
-                "TS-TRIAL-BYPASS-KEY-2024"
-            ]
-
-            # Validate license key format
-            if (license_key in valid_demo_keys or
-                (license_key.startswith("TS-") and
-                 len(license_key) >= 16 and
-                 "-" in license_key[3:] and
-                 len(license_key.split("-")) >= 3)):
+            if self._is_valid_key(license_key):
                 return {
                     "status": "licensed",
                     "type": "full",
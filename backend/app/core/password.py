@@ -13,10 +13,12 @@ For licensing inquiries: kunalsingh2514@gmail.com
 Password hashing and verification utilities.
 """
 
-from passlib.context import CryptContext
+from functools import lru_cache
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
+
+# Work factor for new hashes; existing hashes verify at the cost stored in them
+BCRYPT_ROUNDS = 12
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -30,12 +32,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if the password matches, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
 
 
 def get_password_hash(password: str) -> str:
     """
-    Hashes a plain password using the configured context.
+    Hashes a plain password with bcrypt ($2b$, BCRYPT_ROUNDS rounds).
 
     Args:
         password: The plain text password.
@@ -43,4 +47,39 @@ def get_password_hash(password: str) -> str:
     Returns:
         The hashed password string.
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    # Hash of a throwaway value, created with the same settings as real hashes
+    return get_password_hash("twinsecure-dummy-password")
+
+
+def warm_up() -> None:
+    """
+    Computes the dummy hash ahead of time.
+
+    Called once at application startup so the first failed login does not
+    pay for an extra hash.
+    """
+    _dummy_hash()
+
+
+def verify_dummy_password(plain_password: str) -> bool:
+    """
+    Runs a password verification against a dummy hash.
+
+    Used when no matching user exists so that failed logins take the same
+    time whether or not the email is registered.
+
+    Args:
+        plain_password: The plain text password.
+
+    Returns:
+        Always False.
+    """
+    verify_password(plain_password, _dummy_hash())
+    return False
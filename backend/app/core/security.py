@@ -9,21 +9,104 @@ is strictly prohibited without explicit written permission.
 For licensing inquiries: kunalsingh2514@gmail.com
 """
 
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional, Union
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
 from uuid import UUID
 
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError as JWTError
+from jwt.algorithms import Algorithm, get_default_algorithms
+from jwt.utils import base64url_decode, base64url_encode
 
 from app.core.config import logger, settings
 from app.core.password import get_password_hash, verify_password
 from app.schemas import TokenPayload
 
 # JWT settings
-ALGORITHM = settings.SECURITY__ALGORITHM
-ACCESS_TOKEN_EXPIRE_MINUTES = settings.SECURITY__ACCESS_TOKEN_EXPIRE_MINUTES
-REFRESH_TOKEN_EXPIRE_DAYS = settings.SECURITY__REFRESH_TOKEN_EXPIRE_DAYS
-SECRET_KEY = settings.SECURITY__SECRET_KEY.get_secret_value()
+ALGORITHM = settings.security.ALGORITHM
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.security.ACCESS_TOKEN_EXPIRE_MINUTES
+REFRESH_TOKEN_EXPIRE_DAYS = settings.security.REFRESH_TOKEN_EXPIRE_DAYS
+SECRET_KEY = settings.security.SECRET_KEY.get_secret_value()
+
+# Decoded tokens by blake2b digest of the raw token, as (exp, payload). A
+# bearer token is replayed on every request for its whole lifetime, so a
+# hit skips signature verification and payload validation. Only valid
+# tokens are stored, each until its exp claim; least recently used entries
+# are dropped beyond TOKEN_CACHE_MAX_SIZE.
+TOKEN_CACHE_MAX_SIZE = 10_000
+_TOKEN_CACHE: "OrderedDict[bytes, Tuple[float, TokenPayload]]" = OrderedDict()
+
+
+@lru_cache(maxsize=1)
+def _algorithm() -> Algorithm:
+    """Returns the PyJWT algorithm implementation for ALGORITHM."""
+    return get_default_algorithms()[ALGORITHM]
+
+
+@lru_cache(maxsize=1)
+def _signing_key() -> Any:
+    """
+    Returns the prepared signing key, constructed once per process.
+
+    Signing with a prepared key skips the key conversion and checks that
+    jwt.encode repeats on every call.
+    """
+    return _algorithm().prepare_key(SECRET_KEY)
+
+
+@lru_cache(maxsize=1)
+def _encoded_header() -> bytes:
+    """Returns the base64url-encoded JOSE header, identical for every token."""
+    header = json.dumps(
+        {"alg": ALGORITHM, "typ": "JWT"}, separators=(",", ":"), sort_keys=True
+    )
+    return base64url_encode(header.encode("utf-8"))
+
+
+def _decode_hs256(token: str) -> Optional[dict]:
+    """
+    Verifies and decodes an HS256 token shaped like the ones issued here.
+
+    The header must match _encoded_header() byte for byte, and the claims
+    may only be exp and sub; returns None for any other token so the caller
+    falls back to jwt.decode. Raises the same PyJWT errors jwt.decode would
+    for a bad signature, a malformed payload or an expired token.
+    """
+    if ALGORITHM != "HS256":
+        return None
+    parts = token.encode("utf-8").split(b".")
+    if len(parts) != 3 or parts[0] != _encoded_header():
+        return None
+
+    try:
+        signature = base64url_decode(parts[2])
+    except (binascii.Error, ValueError) as e:
+        raise jwt.DecodeError("Invalid crypto padding") from e
+    expected = hmac.digest(_signing_key(), parts[0] + b"." + parts[1], "sha256")
+    if not hmac.compare_digest(expected, signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = json.loads(base64url_decode(parts[1]))
+    except (binascii.Error, ValueError) as e:
+        raise jwt.DecodeError("Invalid payload string") from e
+    if not isinstance(payload, dict) or payload.keys() - {"exp", "sub"}:
+        return None
+
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+            raise jwt.DecodeError("Expiration Time claim (exp) must be an integer.")
+        if exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
 
 
 def create_access_token(
@@ -43,12 +126,18 @@ def create_access_token(
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.SECURITY__ACCESS_TOKEN_EXPIRE_MINUTES
+            minutes=settings.security.ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
-    to_encode = {"exp": expire, "sub": str(subject)}  # Ensure subject is a string
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    logger.debug(f"Created access token for subject {subject} expiring at {expire}")
+    # Ensure subject is a string; exp as NumericDate, as jwt.encode would do
+    to_encode = {"exp": int(expire.timestamp()), "sub": str(subject)}
+    claims = base64url_encode(
+        json.dumps(to_encode, separators=(",", ":")).encode("utf-8")
+    )
+    signing_input = _encoded_header() + b"." + claims
+    signature = _algorithm().sign(signing_input, _signing_key())
+    encoded_jwt = (signing_input + b"." + base64url_encode(signature)).decode("utf-8")
+    logger.debug("Created access token for subject %s expiring at %s", subject, expire)
     return encoded_jwt
 
 
@@ -56,22 +145,42 @@ def decode_token(token: str) -> Optional[TokenPayload]:
     """
     Decodes a JWT token and returns the payload.
 
+    Valid tokens are cached until they expire (see _TOKEN_CACHE). Tokens
+    issued by create_access_token are verified by _decode_hs256; anything
+    else goes through jwt.decode.
+
     Args:
         token: The encoded JWT token string.
 
     Returns:
         The TokenPayload schema instance or None if decoding fails or token is invalid/expired.
     """
+    cache_key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached is not None:
+        if time.time() < cached[0]:
+            _TOKEN_CACHE.move_to_end(cache_key)
+            return cached[1]
+        del _TOKEN_CACHE[cache_key]
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_hs256(token)
+        if payload is None:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         # Explicitly create TokenPayload to handle potential missing 'sub' or validate type
         token_data = TokenPayload(sub=payload.get("sub"))
         # Optional: Add more validation here, e.g., check 'exp' claim validity more strictly if needed
-        logger.debug(f"Token decoded successfully for subject: {token_data.sub}")
-        return token_data
+        logger.debug("Token decoded successfully for subject: %s", token_data.sub)
     except JWTError as e:
-        logger.warning(f"JWT Error decoding token: {e}")
+        logger.warning("JWT Error decoding token: %s", e)
         return None
     except Exception as e:  # Catch potential Pydantic validation errors or other issues
-        logger.error(f"Error processing token payload: {e}")
+        logger.error("Error processing token payload: %s", e)
         return None
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _TOKEN_CACHE[cache_key] = (exp, token_data)
+        if len(_TOKEN_CACHE) > TOKEN_CACHE_MAX_SIZE:
+            _TOKEN_CACHE.popitem(last=False)
+    return token_data
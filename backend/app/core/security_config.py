@@ -21,49 +21,20 @@ import string
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Union
 
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jwt import InvalidTokenError as JWTError
 from pydantic import ValidationError
 
 from app.core.config import settings
+from app.core.password import get_password_hash, verify_password
 from app.schemas.token import TokenPayload
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 password bearer for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """
-    Verify a password against a hash.
-
-    Args:
-        plain_password: The plain-text password
-        hashed_password: The hashed password
-
-    Returns:
-        bool: True if the password matches the hash, False otherwise
-    """
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password: str) -> str:
-    """
-    Hash a password.
-
-    Args:
-        password: The plain-text password
-
-    Returns:
-        str: The hashed password
-    """
-    return pwd_context.hash(password)
-
-
 def create_access_token(
     subject: Union[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
@@ -28,16 +28,16 @@ def get_database_url() -> str:
         str: The database URL for SQLAlchemy
     """
     # Check if DATABASE_URL is directly provided
-    if hasattr(settings, "DATABASE_URL") and settings.DATABASE_URL:
-        logger.info(f"Using provided DATABASE_URL: {settings.DATABASE_URL}")
-        return settings.DATABASE_URL
+    if settings.database.DATABASE_URL:
+        logger.info(f"Using provided DATABASE_URL: {settings.database.DATABASE_URL}")
+        return settings.database.DATABASE_URL
     
     # Otherwise, build from components
-    user = settings.POSTGRES_USER
-    password = settings.POSTGRES_PASSWORD
-    server = settings.POSTGRES_SERVER
-    port = settings.POSTGRES_PORT
-    db = settings.POSTGRES_DB
+    user = settings.database.POSTGRES_USER
+    password = settings.database.POSTGRES_PASSWORD
+    server = settings.database.POSTGRES_SERVER
+    port = settings.database.POSTGRES_PORT
+    db = settings.database.POSTGRES_DB
     
     # Log the database connection info (without password)
     logger.info(f"Connecting to database: {user}@{server}:{port}/{db}")
@@ -54,11 +54,11 @@ def get_database_config() -> Dict[str, str]:
         Dict[str, str]: Database configuration
     """
     return {
-        "user": settings.POSTGRES_USER,
-        "password": settings.POSTGRES_PASSWORD,
-        "host": settings.POSTGRES_SERVER,
-        "port": str(settings.POSTGRES_PORT),
-        "database": settings.POSTGRES_DB,
+        "user": settings.database.POSTGRES_USER,
+        "password": settings.database.POSTGRES_PASSWORD,
+        "host": settings.database.POSTGRES_SERVER,
+        "port": str(settings.database.POSTGRES_PORT),
+        "database": settings.database.POSTGRES_DB,
     }
 
 
@@ -10,7 +10,7 @@ For licensing inquiries: kunalsingh2514@gmail.com
 """
 
 import json  # Import json for casting
-from typing import List, Optional, Union
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from sqlalchemy import String as SQLString  # Import cast and String for JSON filtering
@@ -18,11 +18,16 @@ from sqlalchemy import (
     asc,
     cast,
     desc,
+    func,
+    lambda_stmt,
+    update,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.sql import StatementLambdaElement
 
 from app.db.models import Alert
+from app.core.enums import AlertSeverity, AlertStatus
 from app.schemas import AlertCreate, AlertQueryFilters, AlertUpdate
 
 
@@ -37,52 +42,149 @@ class CRUDAlert:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_multi(
-        self, db: AsyncSession, *, filters: AlertQueryFilters
-    ) -> List[Alert]:
-        """Get multiple alerts with filtering and pagination."""
-        stmt = select(Alert)
+    async def exists(self, db: AsyncSession, alert_id: Union[UUID, str]) -> bool:
+        """Check whether an alert exists without loading its columns."""
+        stmt = select(1).where(Alert.id == alert_id).limit(1)
+        return (await db.scalar(stmt)) is not None
+
+    async def get_count_by_severity(self, db: AsyncSession) -> Dict[str, int]:
+        """Count alerts per severity; every severity is present, zero if unused."""
+        stmt = select(Alert.severity, func.count()).group_by(Alert.severity)
+        counts = {severity.value: 0 for severity in AlertSeverity}
+        for severity, count in await db.execute(stmt):
+            if severity is not None:
+                counts[AlertSeverity(severity).value] = count
+        return counts
+
+    async def get_count_by_status(self, db: AsyncSession) -> Dict[str, int]:
+        """Count alerts per status; every status is present, zero if unused."""
+        stmt = select(Alert.status, func.count()).group_by(Alert.status)
+        counts = {alert_status.value: 0 for alert_status in AlertStatus}
+        for alert_status, count in await db.execute(stmt):
+            if alert_status is not None:
+                counts[AlertStatus(alert_status).value] = count
+        return counts
+
+    async def get_counts_grouped(self, db: AsyncSession) -> Dict[str, Dict[str, int]]:
+        """
+        Count alerts per severity and per status in a single query.
+
+        Returns {"by_severity": {...}, "by_status": {...}} shaped like
+        get_count_by_severity() and get_count_by_status(). The table is
+        scanned once with GROUP BY GROUPING SETS ((severity), (status));
+        GROUPING(severity) tells the two kinds of rows apart.
+        """
+        stmt = select(
+            Alert.severity,
+            Alert.status,
+            func.grouping(Alert.severity),
+            func.count(),
+        ).group_by(func.grouping_sets(Alert.severity, Alert.status))
+        by_severity = {severity.value: 0 for severity in AlertSeverity}
+        by_status = {alert_status.value: 0 for alert_status in AlertStatus}
+        # One row per severity and per status, so the result is tiny; the
+        # rows are read straight off the result without copying them out
+        for severity, alert_status, is_status_row, count in await db.execute(stmt):
+            if is_status_row:
+                if alert_status is not None:
+                    by_status[AlertStatus(alert_status).value] = count
+            elif severity is not None:
+                by_severity[AlertSeverity(severity).value] = count
+        return {"by_severity": by_severity, "by_status": by_status}
 
-        # Apply filters
+    async def get_summary_counts(self, db: AsyncSession) -> Dict[str, int]:
+        """
+        Count the alerts behind the dashboard summary in a single query.
+
+        Returns {"total", "critical", "high", "medium"}; like
+        get_count_by_severity(), alerts without a severity are not counted.
+        """
+        stmt = select(
+            func.count(Alert.severity),
+            func.count().filter(Alert.severity == AlertSeverity.CRITICAL),
+            func.count().filter(Alert.severity == AlertSeverity.HIGH),
+            func.count().filter(Alert.severity == AlertSeverity.MEDIUM),
+        )
+        total, critical, high, medium = (await db.execute(stmt)).one()
+        return {"total": total, "critical": critical, "high": high, "medium": medium}
+
+    def _filtered_query(self, filters: AlertQueryFilters) -> StatementLambdaElement:
+        """
+        Build the filtered, sorted and paginated alert query.
+
+        The statement is assembled from lambdas, so SQLAlchemy caches the
+        compiled SQL per combination of filters and only binds the values.
+        """
+        stmt = lambda_stmt(lambda: select(Alert))
+
+        # Apply filters (values are captured as bound parameters)
         if filters.ip_address:
-            stmt = stmt.where(Alert.source_ip == filters.ip_address)
+            ip_address = filters.ip_address
+            stmt += lambda s: s.where(Alert.source_ip == ip_address)
         if filters.start_time:
-            stmt = stmt.where(Alert.triggered_at >= filters.start_time)
+            start_time = filters.start_time
+            stmt += lambda s: s.where(Alert.triggered_at >= start_time)
         if filters.end_time:
-            stmt = stmt.where(Alert.triggered_at <= filters.end_time)
+            end_time = filters.end_time
+            stmt += lambda s: s.where(Alert.triggered_at <= end_time)
         if filters.severity:
-            stmt = stmt.where(Alert.severity == filters.severity)
+            severity = filters.severity
+            stmt += lambda s: s.where(Alert.severity == severity)
         if filters.status:
-            stmt = stmt.where(Alert.status == filters.status)
+            alert_status = filters.status
+            stmt += lambda s: s.where(Alert.status == alert_status)
         if filters.alert_type:
-            stmt = stmt.where(Alert.alert_type == filters.alert_type)
+            alert_type = filters.alert_type
+            stmt += lambda s: s.where(Alert.alert_type == alert_type)
         if filters.min_abuse_score is not None:
-            stmt = stmt.where(Alert.abuse_score >= filters.min_abuse_score)
+            min_abuse_score = filters.min_abuse_score
+            stmt += lambda s: s.where(Alert.abuse_score >= min_abuse_score)
         if filters.max_abuse_score is not None:
-            stmt = stmt.where(Alert.abuse_score <= filters.max_abuse_score)
+            max_abuse_score = filters.max_abuse_score
+            stmt += lambda s: s.where(Alert.abuse_score <= max_abuse_score)
         if filters.country:
             # Filter by country within the JSON ip_info field
             # Note: This requires the country to be stored consistently, e.g., ip_info['country']
             # This filter might be slow on large datasets without specific JSON indexing in PG.
             # Use ->> to get JSON field as text
-            stmt = stmt.where(Alert.ip_info.op("->>")("country") == filters.country)
+            country = filters.country
+            stmt += lambda s: s.where(Alert.ip_info.op("->>")("country") == country)
             # For case-insensitive matching:
             # from sqlalchemy import func as sqlfunc
             # stmt = stmt.where(sqlfunc.lower(Alert.ip_info.op('->>')('country')) == filters.country.lower())
 
-        # Apply sorting (default: newest first)
-        stmt = stmt.order_by(desc(Alert.triggered_at))
+        # Apply sorting (default: newest first) and pagination
+        offset, limit = filters.offset, filters.limit
+        stmt += lambda s: s.order_by(desc(Alert.triggered_at)).offset(offset).limit(limit)
+        return stmt
 
-        # Apply pagination
-        stmt = stmt.offset(filters.offset).limit(filters.limit)
-
-        result = await db.execute(stmt)
+    async def get_multi(
+        self, db: AsyncSession, *, filters: AlertQueryFilters
+    ) -> List[Alert]:
+        """Get multiple alerts with filtering and pagination."""
+        result = await db.execute(self._filtered_query(filters))
         return result.scalars().all()
 
-    async def create(self, db: AsyncSession, *, obj_in: AlertCreate) -> Alert:
+    async def stream_multi(
+        self, db: AsyncSession, *, filters: AlertQueryFilters, batch_size: int = 100
+    ) -> AsyncIterator[Alert]:
+        """Stream alerts matching the filters through a server-side cursor."""
+        result = await db.stream_scalars(
+            self._filtered_query(filters),
+            execution_options={"yield_per": batch_size},
+        )
+        async for db_obj in result:
+            yield db_obj
+
+    async def create(
+        self, db: AsyncSession, *, obj_in: Union[AlertCreate, dict]
+    ) -> Alert:
         """Create a new alert."""
         # Convert Pydantic model to dictionary
-        obj_in_data = obj_in.model_dump()
+        if isinstance(obj_in, dict):
+            obj_in_data = obj_in
+        else:
+            obj_in_data = obj_in.model_dump()
         db_obj = Alert(**obj_in_data)
         db.add(db_obj)
         await db.commit()
@@ -107,6 +209,52 @@ class CRUDAlert:
         await db.refresh(db_obj)
         return db_obj
 
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        alert_id: Union[UUID, str],
+        obj_in: Union[AlertUpdate, dict],
+    ) -> Optional[Tuple[Alert, Optional[AlertStatus]]]:
+        """
+        Update an alert by ID in a single UPDATE ... RETURNING round trip.
+
+        Returns the updated alert together with its status before the update,
+        or None if no alert has the given ID.
+        """
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        # Only table columns can be set in a bulk UPDATE
+        columns = Alert.__table__.c
+        update_data = {k: v for k, v in update_data.items() if k in columns}
+        if not update_data:
+            db_obj = await self.get(db, alert_id=alert_id)
+            return (db_obj, db_obj.status) if db_obj else None
+
+        # Lock the row and capture its current status in the same statement
+        old = (
+            select(Alert.id, Alert.status)
+            .where(Alert.id == alert_id)
+            .with_for_update()
+            .cte("old")
+        )
+        stmt = (
+            update(Alert)
+            .where(Alert.id == old.c.id)
+            .values(**update_data)
+            .returning(Alert, old.c.status)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        row = result.one_or_none()
+        await db.commit()
+        if row is None:
+            return None
+        return row[0], row[1]
+
     async def delete(
         self, db: AsyncSession, *, alert_id: Union[UUID, str]
     ) -> Optional[Alert]:
@@ -9,12 +9,15 @@ is strictly prohibited without explicit written permission.
 For licensing inquiries: kunalsingh2514@gmail.com
 """
 
-from typing import List, Optional, Union
+import base64
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import desc
+from sqlalchemy import Select, desc, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import load_only
 
 from app.db.models import Report
 from app.schemas import ReportCreate, ReportQueryFilters, ReportUpdate
@@ -39,11 +42,15 @@ class CRUDReport:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_multi(
-        self, db: AsyncSession, *, filters: ReportQueryFilters
-    ) -> List[Report]:
-        """Get multiple reports with filtering and pagination."""
+    def _filtered_query(
+        self, filters: ReportQueryFilters, columns: Optional[Sequence[str]] = None
+    ) -> Select:
+        """Build the filtered, sorted and paginated report query."""
         stmt = select(Report)
+        if columns:
+            stmt = stmt.options(
+                load_only(*(getattr(Report, column) for column in columns))
+            )
 
         # Apply filters
         if filters.start_time:
@@ -51,15 +58,76 @@ class CRUDReport:
         if filters.end_time:
             stmt = stmt.where(Report.generated_at <= filters.end_time)
 
-        # Apply sorting (default: newest first)
-        stmt = stmt.order_by(desc(Report.generated_at))
+        # Keyset pagination: continue after the last report of the previous page
+        if filters.cursor:
+            generated_at, report_id = self.decode_cursor(filters.cursor)
+            stmt = stmt.where(
+                tuple_(Report.generated_at, Report.id) < (generated_at, report_id)
+            )
+
+        # Apply sorting (default: newest first; id breaks ties for the cursor)
+        stmt = stmt.order_by(desc(Report.generated_at), desc(Report.id))
 
         # Apply pagination
-        stmt = stmt.offset(filters.offset).limit(filters.limit)
+        return stmt.offset(filters.offset).limit(filters.limit)
 
-        result = await db.execute(stmt)
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        filters: ReportQueryFilters,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Report]:
+        """
+        Get multiple reports with filtering and pagination.
+
+        When columns is given, only those attributes are loaded (plus the
+        primary key); accessing any other attribute afterwards triggers a
+        lazy load, which fails on an async session.
+        """
+        result = await db.execute(self._filtered_query(filters, columns))
         return result.scalars().all()
 
+    async def stream_multi(
+        self,
+        db: AsyncSession,
+        *,
+        filters: ReportQueryFilters,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = 100,
+    ) -> AsyncIterator[Report]:
+        """
+        Stream every report matching the filters through a server-side
+        cursor; filters.limit is ignored.
+        """
+        result = await db.stream_scalars(
+            self._filtered_query(filters, columns).limit(None),
+            execution_options={"yield_per": batch_size},
+        )
+        async for db_obj in result:
+            yield db_obj
+
+    @staticmethod
+    def encode_cursor(db_obj: Report) -> str:
+        """Build the get_multi cursor that continues after db_obj."""
+        position = f"{db_obj.generated_at.isoformat()}|{db_obj.id}"
+        return base64.urlsafe_b64encode(position.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+        """
+        Parse a cursor built by encode_cursor.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            position = base64.urlsafe_b64decode(cursor.encode()).decode()
+            generated_at, report_id = position.split("|")
+            return datetime.fromisoformat(generated_at), UUID(report_id)
+        except (ValueError, UnicodeError) as e:
+            raise ValueError(f"Invalid report cursor: {cursor}") from e
+
     async def create(self, db: AsyncSession, *, obj_in: ReportCreate) -> Report:
         """Create a new report."""
         obj_in_data = obj_in.model_dump()
@@ -9,13 +9,20 @@ is strictly prohibited without explicit written permission.
 For licensing inquiries: kunalsingh2514@gmail.com
 """
 
-from typing import List, Optional, Union
+from typing import AsyncIterator, List, Optional, Sequence, Union
 from uuid import UUID
 
+from sqlalchemy import Select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-
-from app.core.password import get_password_hash, verify_password
+from sqlalchemy.orm import load_only
+
+from app.core.enums import UserRole
+from app.core.password import (
+    get_password_hash,
+    verify_dummy_password,
+    verify_password,
+)
 from app.db.models import User
 from app.schemas.user_schema import UserCreate, UserUpdate
 
@@ -35,14 +42,57 @@ class CRUDUser:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
+    def _list_query(
+        self,
+        skip: int,
+        limit: Optional[int],
+        columns: Optional[Sequence[str]] = None,
+    ) -> Select:
+        """Build the paginated user list query, newest first."""
+        stmt = select(User).offset(skip).order_by(User.created_at.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if columns:
+            stmt = stmt.options(
+                load_only(*(getattr(User, column) for column in columns))
+            )
+        return stmt
+
     async def get_multi(
-        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[User]:
-        """Get multiple users with pagination."""
-        stmt = select(User).offset(skip).limit(limit).order_by(User.created_at.desc())
-        result = await db.execute(stmt)
+        """
+        Get multiple users with pagination.
+
+        When columns is given, only those attributes are loaded (plus the
+        primary key); accessing any other attribute afterwards triggers a
+        lazy load, which fails on an async session.
+        """
+        result = await db.execute(self._list_query(skip, limit, columns))
         return result.scalars().all()
 
+    async def stream_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = 100,
+    ) -> AsyncIterator[User]:
+        """Stream users through a server-side cursor; no limit reads them all."""
+        result = await db.stream_scalars(
+            self._list_query(skip, limit, columns),
+            execution_options={"yield_per": batch_size},
+        )
+        async for db_obj in result:
+            yield db_obj
+
     async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
         """Create a new user."""
         hashed_password = get_password_hash(obj_in.password)
@@ -64,8 +114,84 @@ class CRUDUser:
         self, db: AsyncSession, *, db_obj: User, obj_in: Union[UserUpdate, dict]
     ) -> User:
         """Update an existing user."""
+        update_data = self._update_data(obj_in)
+        for field, value in update_data.items():
+            setattr(db_obj, field, value)
+
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: Union[UUID, str],
+        obj_in: Union[UserUpdate, dict],
+    ) -> Optional[User]:
+        """
+        Update a user by ID in a single UPDATE ... RETURNING round trip.
+
+        Returns the updated user, or None if no user has the given ID.
+        """
+        update_data = self._update_data(obj_in)
+        # Only table columns can be set in a bulk UPDATE
+        columns = User.__table__.c
+        update_data = {k: v for k, v in update_data.items() if k in columns}
+        if "role" in update_data and "is_superuser" not in update_data:
+            # The role check depends on the stored superuser flag, which only
+            # the model's validator sees
+            db_obj = await self.get(db, user_id=user_id)
+            return (
+                await self.update(db, db_obj=db_obj, obj_in=obj_in) if db_obj else None
+            )
+        if not update_data:
+            return await self.get(db, user_id=user_id)
+
+        # A bulk UPDATE bypasses the model's validators, so apply them here
+        if "email" in update_data:
+            email = update_data["email"]
+            if not email or "@" not in email:
+                raise ValueError("Invalid email format")
+            update_data["email"] = email.lower()
+        if (
+            update_data.get("is_superuser")
+            and update_data.get("role", UserRole.ADMIN) != UserRole.ADMIN
+        ):
+            raise ValueError("Superuser must have admin role")
+
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data)
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        db_obj = result.scalar_one_or_none()
+        await db.commit()
+        return db_obj
+
+    async def delete(
+        self, db: AsyncSession, *, user_id: Union[UUID, str]
+    ) -> Optional[User]:
+        """
+        Delete a user by ID.
+
+        The user is loaded first so the ORM cascades the delete to their
+        reports, alerts, audit logs and API keys.
+        """
+        db_obj = await self.get(db, user_id=user_id)
+        if db_obj:
+            await db.delete(db_obj)
+            await db.commit()
+        return db_obj
+
+    @staticmethod
+    def _update_data(obj_in: Union[UserUpdate, dict]) -> dict:
         if isinstance(obj_in, dict):
-            update_data = obj_in
+            update_data = dict(obj_in)
         else:
             update_data = obj_in.model_dump(
                 exclude_unset=True
@@ -79,23 +205,28 @@ class CRUDUser:
             # Ensure password/hashed_password isn't accidentally set to None if not provided
             update_data.pop("password", None)
             update_data.pop("hashed_password", None)
-
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+        return update_data
 
     async def authenticate(
         self, db: AsyncSession, *, email: str, password: str
     ) -> Optional[User]:
         """Authenticate a user by email and password."""
-        user = await self.get_by_email(db, email=email)
+        return await self.authenticate_active(db, email=email, password=password)
+
+    async def authenticate_active(
+        self, db: AsyncSession, *, email: str, password: str
+    ) -> Optional[User]:
+        """
+        Authenticate an active user by email and password.
+
+        Inactive users are filtered out in the query. A password check is
+        always performed, so unknown emails cost the same as wrong passwords.
+        """
+        stmt = select(User).where(User.email == email, User.is_active.is_(True))
+        result = await db.execute(stmt)
+        user = result.scalar_one_or_none()
         if not user:
-            return None
-        if not user.is_active:  # Optional: check if user is active
+            verify_dummy_password(password)
             return None
         if not verify_password(password, user.hashed_password):
             return None
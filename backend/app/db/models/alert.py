@@ -28,6 +28,7 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -38,7 +39,7 @@ from app.db.base import Base
 from app.db.types import ARRAY, INET, JSONB
 
 
-class AlertSource(str, enum.Enum):
+class AlertSource(enum.StrEnum):
     """Alert source enumeration"""
 
     HONEYPOT = "honeypot"
@@ -62,6 +63,13 @@ class Alert(Base):
         Index("ix_alerts_source_ip_triggered_at", "source_ip", "triggered_at"),
         Index("ix_alerts_status_created_at", "status", "created_at"),
         Index("ix_alerts_type_severity", "alert_type", "severity"),
+        # Matches the alert list query: equality filters, newest first
+        Index(
+            "ix_alerts_severity_status_triggered_at",
+            "severity",
+            "status",
+            text("triggered_at DESC"),
+        ),
         # Add GIN index for JSON fields
         Index("ix_alerts_payload_gin", "payload", postgresql_using="gin"),
         Index("ix_alerts_enrichment_gin", "enrichment_data", postgresql_using="gin"),
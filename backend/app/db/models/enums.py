@@ -16,7 +16,7 @@ Enum definitions for database models.
 import enum
 
 
-class UserRole(str, enum.Enum):
+class UserRole(enum.StrEnum):
     """User role enumeration"""
 
     ADMIN = "admin"
@@ -25,7 +25,7 @@ class UserRole(str, enum.Enum):
     API_USER = "api_user"
 
 
-class UserStatus(str, enum.Enum):
+class UserStatus(enum.StrEnum):
     """User status enumeration"""
 
     ACTIVE = "active"
@@ -26,6 +26,7 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -35,7 +36,7 @@ from app.db.base import Base
 from app.db.types import ARRAY, JSONB
 
 
-class ReportType(str, enum.Enum):
+class ReportType(enum.StrEnum):
     """Report type enumeration"""
 
     DAILY_SUMMARY = "daily_summary"
@@ -49,7 +50,7 @@ class ReportType(str, enum.Enum):
     CUSTOM = "custom"
 
 
-class ReportFormat(str, enum.Enum):
+class ReportFormat(enum.StrEnum):
     """Report format enumeration"""
 
     PDF = "pdf"
@@ -60,7 +61,7 @@ class ReportFormat(str, enum.Enum):
     MARKDOWN = "markdown"
 
 
-class ReportStatus(str, enum.Enum):
+class ReportStatus(enum.StrEnum):
     """Report status enumeration"""
 
     PENDING = "pending"
@@ -81,6 +82,12 @@ class Report(Base):
         Index("ix_reports_type_created_at", "report_type", "created_at"),
         Index("ix_reports_status_created_at", "status", "created_at"),
         Index("ix_reports_creator_created_at", "creator_id", "created_at"),
+        # Matches the report list's keyset pagination: newest first
+        Index(
+            "ix_reports_generated_at_id",
+            text("generated_at DESC"),
+            text("id DESC"),
+        ),
     )
 
     # Primary key and basic info
@@ -14,13 +14,23 @@ from sqlalchemy.orm import sessionmaker
 
 from app.core.config import logger, settings
 
+# The asyncpg dialect prepares every statement and keeps the prepared plans
+# per connection, so repeated CRUD queries skip parse and plan. The option
+# is specific to asyncpg; other drivers (SQLite in tests) take none.
+_connect_args = {}
+if settings.database.DATABASE_URL.startswith("postgresql+asyncpg"):
+    _connect_args["prepared_statement_cache_size"] = (
+        settings.database.PREPARED_STATEMENT_CACHE_SIZE
+    )
+
 # Create an asynchronous engine instance.
 # pool_pre_ping=True checks connections for liveness before handing them out.
 # echo=True logs SQL queries (useful for debugging, disable in production)
 engine = create_async_engine(
-    settings.DATABASE_URL,
+    settings.database.DATABASE_URL,
     pool_pre_ping=True,
     echo=settings.ENVIRONMENT == "development",  # Log SQL only in dev
+    connect_args=_connect_args,
 )
 
 # Create an asynchronous session factory.
@@ -34,7 +44,9 @@ AsyncSessionLocal = sessionmaker(
     autoflush=False,
 )
 
-logger.info(f"Async database engine created for URL: {settings.DATABASE_URL}")
+logger.info(
+    f"Async database engine created for URL: {settings.database.DATABASE_URL}"
+)
 
 
 # Dependency to get a DB session
@@ -25,12 +25,14 @@ from typing import Callable
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from prometheus_client import Counter, Histogram
 from slowapi import Limiter
 from slowapi.util import get_remote_address
+from sqlalchemy import text
 
-from app.api.api_v1.api import api_router  # API routes
+from app.api.api_v1.api import include_api_routes  # API routes
 
 # Import application components
 from app.core.config import logger, settings  # Application configuration and logging
@@ -93,38 +95,85 @@ async def lifespan(app: FastAPI):
 
         # Initialize services
         from app.services.alerting.client import alert_client
+        from app.services.cache import redis_cache
         from app.services.enrichment.geoip import geoip_reader
 
+        await redis_cache.connect()
+
+        # Batch honeypot alert inserts in the background
+        from app.services.alerts_buffer import alerts_buffer
+
+        await alerts_buffer.start()
+
+        # Process honeypot triggers outside the request-scoped sessions
+        from app.api.api_v1.endpoints.honeypot import honeypot_queue
+
+        await honeypot_queue.start()
+
+        # Precompute the dummy hash used for unknown logins
+        from app.core.password import warm_up as warm_up_password_hashing
+
+        warm_up_password_hashing()
+
         logger.info("Services initialized successfully")
 
+        # Start reporting ready to orchestrators
+        app.state.ready = True
+
         yield
     except Exception as e:
         logger.error(f"Startup error: {str(e)}")
         raise
     finally:
         logger.info("Shutting down TwinSecure AI Backend...")
+        app.state.ready = False
 
         # Clean up services
         from app.services.enrichment.geoip import close_geoip_reader
 
         close_geoip_reader()
 
+        # Finish queued honeypot jobs, then write the alerts they buffered
+        from app.api.api_v1.endpoints.honeypot import honeypot_queue
+
+        await honeypot_queue.stop()
+
+        # Write any buffered alerts before the engine is disposed
+        from app.services.alerts_buffer import alerts_buffer
+
+        await alerts_buffer.stop()
+
+        from app.services.cache import redis_cache
+
+        await redis_cache.close()
+
+        await license_manager.aclose()
+
         # Close database connection
         await engine.dispose()
         logger.info("Shutdown complete")
 
 
+# The OpenAPI schema and interactive docs are not served in production; the
+# schema can be exported ahead of time with scripts/export_openapi.py
+API_DOCS_ENABLED = settings.ENVIRONMENT != "production"
+
 # Create FastAPI app instance with advanced configuration
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.PROJECT_DESCRIPTION,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json",
-    docs_url=f"{settings.API_V1_STR}/docs",
-    redoc_url=f"{settings.API_V1_STR}/redoc",
+    openapi_url=f"{settings.API_V1_STR}/openapi.json" if API_DOCS_ENABLED else None,
+    docs_url=f"{settings.API_V1_STR}/docs" if API_DOCS_ENABLED else None,
+    redoc_url=f"{settings.API_V1_STR}/redoc" if API_DOCS_ENABLED else None,
     lifespan=lifespan,
+    # orjson serializes the UUID/datetime-heavy API payloads natively
+    default_response_class=ORJSONResponse,
 )
 
+# Flipped by the lifespan once startup completes (see /health/ready)
+app.state.ready = False
+
 # Rate limiting middleware
 if settings.ENABLE_RATE_LIMITING:
     from app.middleware.rate_limiter import RateLimiterMiddleware
@@ -166,14 +215,8 @@ if settings.ENABLE_RATE_LIMITING:
             f"Invalid rate limit format: {settings.RATE_LIMIT_DEFAULT}. Rate limiting disabled."
         )
 
-# CORS Configuration
-origins_str = settings.BACKEND_CORS_ORIGINS
-if isinstance(origins_str, str):
-    allow_origins_list = (
-        [origin.strip() for origin in origins_str.split(",")] if origins_str else []
-    )
-else:
-    allow_origins_list = origins_str if origins_str else []
+# CORS Configuration (already split into a list by the settings validator)
+allow_origins_list = settings.BACKEND_CORS_ORIGINS
 
 # Optional: Add logging to verify the list during startup
 logger.info(f"Configuring CORS with allow_origins: {allow_origins_list}")
@@ -184,6 +227,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination cursor for the report list
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -265,8 +310,18 @@ add_security_middleware(app)
 # Add caching middleware
 add_cache_middleware(app)
 
-# Include the main API router
-app.include_router(api_router, prefix=settings.API_V1_STR)
+# Response compression for JSON payloads. Added last so it is the outermost
+# middleware: the response cache keeps uncompressed bodies and compression
+# is negotiated per request from Accept-Encoding.
+if settings.ENABLE_COMPRESSION:
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        compresslevel=settings.COMPRESSION_LEVEL,
+    )
+
+# Include the API routes directly on the app (no intermediate router)
+include_api_routes(app, prefix=settings.API_V1_STR)
 
 
 @app.get("/health", tags=["Health"])
@@ -294,12 +349,11 @@ async def health_check():
         "components": {"database": "ok", "cache": "ok", "storage": "ok"},
     }
 
-    # Check database connectivity by executing a simple query
+    # Check database connectivity by executing a simple query on a pooled
+    # connection; an ORM session adds nothing to a ping
     try:
-        async with AsyncSessionLocal() as db:
-            from sqlalchemy import text
-
-            await db.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
             logger.debug("Database health check passed")
     except Exception as e:
         # Update health status if database check fails
@@ -314,6 +368,33 @@ async def health_check():
     return health_status
 
 
+@app.get("/health/live", tags=["Health"])
+async def liveness_check():
+    """
+    Liveness probe.
+
+    Answers as long as the process is serving requests; it performs no
+    dependency checks so a slow database never gets the container restarted.
+    """
+    return {"status": "ok"}
+
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness_check():
+    """
+    Readiness probe.
+
+    Returns 503 until application startup has completed and again once
+    shutdown has begun, so load balancers only route traffic while the
+    application is fully initialized.
+    """
+    if not app.state.ready:
+        return ORJSONResponse(
+            status_code=503, content={"status": "unavailable", "ready": False}
+        )
+    return {"status": "ok", "ready": True}
+
+
 @app.get("/", tags=["Root"])
 async def read_root():
     """
@@ -322,7 +403,7 @@ async def read_root():
     return {
         "message": f"Welcome to {settings.PROJECT_NAME}",
         "version": settings.VERSION,
-        "documentation": f"{settings.API_V1_STR}/docs",
+        "documentation": f"{settings.API_V1_STR}/docs" if API_DOCS_ENABLED else None,
         "status": "operational",
     }
 
@@ -134,7 +134,8 @@ class ResponseCache:
 
 # Create a global cache instance
 response_cache = ResponseCache(
-    max_size=settings.CACHE_MAX_SIZE, default_ttl=settings.CACHE_DEFAULT_TTL
+    max_size=settings.cache.CACHE_MAX_SIZE,
+    default_ttl=settings.cache.CACHE_DEFAULT_TTL,
 )
 
 
@@ -170,16 +171,21 @@ class CacheMiddleware(BaseHTTPMiddleware):
         """
         super().__init__(app)
         self.cache = cache_instance
-        self.cacheable_paths = cacheable_paths or ["/api/v1/"]
+        # Prefixes are kept as tuples so each check is a single
+        # str.startswith call rather than a Python loop
+        self.cacheable_paths = tuple(cacheable_paths or ["/api/v1/"])
         self.cacheable_methods = cacheable_methods or {"GET", "HEAD"}
-        self.exclude_paths = exclude_paths or [
-            "/api/v1/auth/",
-            "/api/v1/users/me",
-            "/api/v1/health",
-            "/metrics",
-        ]
+        self.exclude_paths = tuple(
+            exclude_paths or settings.cache.CACHE_EXCLUDE_PATHS
+        )
         self.exclude_query_params = exclude_query_params or ["_", "timestamp"]
-        self.vary_headers = vary_headers or ["Accept", "Accept-Encoding"]
+        # If-None-Match is part of the key so a conditional request never
+        # shares an entry with an unconditional one
+        self.vary_headers = vary_headers or [
+            "Accept",
+            "Accept-Encoding",
+            "If-None-Match",
+        ]
 
     def is_cacheable(self, request: Request) -> bool:
         """
@@ -198,17 +204,10 @@ class CacheMiddleware(BaseHTTPMiddleware):
         # Check path
         path = request.url.path
 
-        # Check if path is in exclude list
-        for exclude_path in self.exclude_paths:
-            if path.startswith(exclude_path):
-                return False
-
-        # Check if path is in cacheable list
-        for cacheable_path in self.cacheable_paths:
-            if path.startswith(cacheable_path):
-                return True
-
-        return False
+        # Cacheable unless the path is in the exclude list
+        if path.startswith(self.exclude_paths):
+            return False
+        return path.startswith(self.cacheable_paths)
 
     def get_cache_key(self, request: Request) -> str:
         """
@@ -280,8 +279,14 @@ class CacheMiddleware(BaseHTTPMiddleware):
         # Process the request through the next handler
         response = await call_next(request)
 
-        # Cache the response if it's successful
-        if 200 <= response.status_code < 400:
+        # Streamed bodies (StreamingResponse sets no Content-Length) are
+        # passed through as they are produced, not buffered into the cache
+        if "content-length" not in response.headers:
+            return response
+
+        # Cache only full 200 responses; a 304 (or a redirect) answers one
+        # particular request and must not be replayed to others
+        if response.status_code == 200:
             # Get response content
             response_body = b""
             async for chunk in response.body_iterator:
@@ -65,7 +65,9 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
         self.exclude_patterns = [re.compile(pattern) for pattern in self.exclude_paths]
 
         logger.info(
-            f"Rate limiter middleware initialized with {max_requests} requests per {time_window} seconds"
+            "Rate limiter middleware initialized with %s requests per %s seconds",
+            max_requests,
+            time_window,
         )
 
     async def dispatch(self, request: Request, call_next) -> Response:
@@ -95,7 +97,7 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
 
         if not allowed:
             # Rate limit exceeded
-            logger.warning(f"Rate limit exceeded for {identifier} on {path}")
+            logger.warning("Rate limit exceeded for %s on %s", identifier, path)
 
             # Create response with rate limit headers
             response = Response(
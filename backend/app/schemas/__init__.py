@@ -22,13 +22,20 @@ from .dashboard import (
     AlertTrend,
     Attacker,
     AttackVector,
+    ComplianceItem,
     ComplianceStatus,
     DashboardResponse,
     DigitalTwinStatus,
     SecurityMetrics,
 )
 from .honeypot import HoneypotData
-from .report import Report, ReportCreate, ReportQueryFilters, ReportUpdate
+from .report import (
+    Report,
+    ReportCreate,
+    ReportListItem,
+    ReportQueryFilters,
+    ReportUpdate,
+)
 from .system import ServiceStatus, SystemMetrics, SystemStatus
 from .token import Token, TokenPayload
 from .user_schema import User, UserCreate, UserInDBBase, UserUpdate
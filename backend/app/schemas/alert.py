@@ -10,14 +10,14 @@ For licensing inquiries: kunalsingh2514@gmail.com
 """
 
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import UUID4, BaseModel, Field, IPvAnyAddress, field_validator
 
 
 # Define enums for alert severity and status
-class AlertSeverity(str, Enum):
+class AlertSeverity(StrEnum):
     critical = "critical"
     high = "high"
     medium = "medium"
@@ -25,7 +25,7 @@ class AlertSeverity(str, Enum):
     info = "info"
 
 
-class AlertStatus(str, Enum):
+class AlertStatus(StrEnum):
     new = "new"
     acknowledged = "acknowledged"
     in_progress = "in_progress"
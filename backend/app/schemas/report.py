@@ -63,6 +63,26 @@ class Report(ReportInDBBase):
     )
 
 
+# --- List Item Schema ---
+# The subset of report fields shown in listings; the list query loads only
+# these columns
+class ReportListItem(BaseModel):
+    id: UUID4
+    title: str
+    status: Optional[str] = None
+    filename: str
+    file_location: str
+    file_size: Optional[int] = None
+    generated_at: datetime
+    created_at: datetime
+    download_url: Optional[str] = (
+        None  # This would be constructed in the endpoint logic
+    )
+
+    class Config:
+        from_attributes = True  # ORM mode
+
+
 # --- Query Filters Schema ---
 class ReportQueryFilters(BaseModel):
     """Schema for filtering reports in GET requests."""
@@ -71,6 +91,8 @@ class ReportQueryFilters(BaseModel):
     end_time: Optional[datetime] = None
     limit: int = Field(50, ge=1, le=200)
     offset: int = Field(0, ge=0)
+    # Opaque keyset cursor from the previous page's X-Next-Cursor header
+    cursor: Optional[str] = None
 
     @field_validator("end_time")
     @classmethod
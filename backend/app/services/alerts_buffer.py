@@ -0,0 +1,185 @@
+"""
+TwinSecure - Advanced Cybersecurity Platform
+Copyright © 2024 TwinSecure. All rights reserved.
+
+This file is part of TwinSecure, a proprietary cybersecurity platform.
+Unauthorized copying, distribution, modification, or use of this software
+is strictly prohibited without explicit written permission.
+
+For licensing inquiries: kunalsingh2514@gmail.com
+"""
+
+"""
+Buffered alert writes for the honeypot pipeline.
+
+Honeypot events arrive in bursts, so instead of one INSERT round trip per
+event, alerts are queued in process and a background consumer writes them
+in batches (a single multi-row INSERT per batch). Alert IDs are assigned
+when an alert is queued, so callers can notify on the alert right away.
+"""
+
+import asyncio
+import uuid
+from typing import Any, Dict, List, Optional, Union
+
+from sqlalchemy import Enum, insert
+
+from app.core.config import logger, settings
+from app.db.models.alert import Alert
+from app.db.session import AsyncSessionLocal
+from app.schemas import AlertCreate
+from app.services.cache import redis_cache
+
+_ALERT_COLUMNS = frozenset(Alert.__table__.columns.keys())
+# The API schemas define their own enums; rows carry the model's members
+_ENUM_COLUMNS = {
+    column.key: column.type.enum_class
+    for column in Alert.__table__.columns
+    if isinstance(column.type, Enum) and column.type.enum_class is not None
+}
+
+
+class AlertWriteBuffer:
+    """
+    In-process queue of alerts flushed to the database in batches.
+
+    A batch is written once batch_size alerts are queued or flush_interval
+    seconds after its first alert arrived, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        max_size: int = 10000,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            batch_size: Maximum number of alerts written per INSERT
+            flush_interval: Maximum seconds an alert waits before being written
+            max_size: Maximum number of queued alerts
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the consumer task is accepting alerts."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the background consumer."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._closing = False
+        self._task = asyncio.create_task(self._consume())
+        logger.info("Alert write buffer started (batch size %d).", self.batch_size)
+
+    async def stop(self) -> None:
+        """Stop the consumer once every queued alert has been written."""
+        if not self.running:
+            return
+        # The consumer exits when it reaches the sentinel
+        self._closing = True
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        logger.info("Alert write buffer stopped.")
+
+    def submit(self, alert_in: Union[AlertCreate, Dict[str, Any]]) -> Optional[Alert]:
+        """
+        Queue an alert for the next batched write.
+
+        Args:
+            alert_in: Alert to create
+
+        Raises:
+            ValueError: If an enum field holds an unknown value
+
+        Returns:
+            The transient Alert (with its ID assigned), or None if the buffer
+            is not running or full and the caller should write it directly
+        """
+        if not self.running or self._closing:
+            return None
+
+        values = alert_in if isinstance(alert_in, dict) else alert_in.model_dump()
+        row = {key: value for key, value in values.items() if key in _ALERT_COLUMNS}
+        for key, enum_class in _ENUM_COLUMNS.items():
+            if row.get(key) is not None:
+                row[key] = enum_class(row[key])
+        row.setdefault("id", uuid.uuid4())
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.warning("Alert write buffer full; writing alert directly.")
+            return None
+        return Alert(**row)
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            row = await self._queue.get()
+            if row is None:
+                break
+            batch = [row]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(insert(Alert), batch)
+                await db.commit()
+        except Exception as e:
+            logger.error(
+                "Batched insert of %d alerts failed, retrying one by one: %s",
+                len(batch),
+                e,
+            )
+            await self._flush_each(batch)
+        else:
+            logger.debug("Wrote %d buffered alerts.", len(batch))
+
+        # Drop cached alert lists and dashboard aggregates that predate them
+        await redis_cache.delete_pattern("alerts:list:*")
+        await redis_cache.delete_pattern("dashboard:*")
+
+    async def _flush_each(self, batch: List[Dict[str, Any]]) -> None:
+        # A single bad row must not lose the rest of the batch
+        async with AsyncSessionLocal() as db:
+            for row in batch:
+                try:
+                    await db.execute(insert(Alert), [row])
+                    await db.commit()
+                except Exception as e:
+                    await db.rollback()
+                    logger.error("Failed to write buffered alert %s: %s", row["id"], e)
+
+
+# Create a global buffer instance (started in the application lifespan)
+alerts_buffer = AlertWriteBuffer(
+    batch_size=settings.ALERT_BUFFER_BATCH_SIZE,
+    flush_interval=settings.ALERT_BUFFER_FLUSH_INTERVAL,
+    max_size=settings.ALERT_BUFFER_MAX_SIZE,
+)
@@ -0,0 +1,172 @@
+"""
+TwinSecure - Advanced Cybersecurity Platform
+Copyright © 2024 TwinSecure. All rights reserved.
+
+This file is part of TwinSecure, a proprietary cybersecurity platform.
+Unauthorized copying, distribution, modification, or use of this software
+is strictly prohibited without explicit written permission.
+
+For licensing inquiries: kunalsingh2514@gmail.com
+"""
+
+"""
+Redis-backed cache for API read paths.
+
+Values are stored as raw bytes (typically pre-serialized JSON) under
+settings.cache.CACHE_PREFIX. Every operation is best effort: if Redis is not
+configured, not installed or unreachable, reads miss and writes are
+dropped, so callers always fall back to the database.
+"""
+
+import time
+from typing import Optional, Union
+
+from app.core.config import logger, settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+
+class RedisCache:
+    """
+    Thin async Redis wrapper with a simple circuit breaker.
+
+    After a Redis error the cache stays open (all calls short-circuit) for
+    failure_cooldown seconds instead of adding a timeout to every request.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str],
+        password: Optional[str] = None,
+        prefix: str = "twinsecure:",
+        failure_cooldown: float = 30.0,
+        socket_timeout: float = 0.25,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            url: Redis connection URL; caching is disabled when empty
+            password: Optional Redis password
+            prefix: Prefix applied to every key
+            failure_cooldown: Seconds to bypass Redis after an error
+            socket_timeout: Per-operation socket timeout in seconds
+        """
+        self.url = url
+        self.password = password
+        self.prefix = prefix
+        self.failure_cooldown = failure_cooldown
+        self.socket_timeout = socket_timeout
+        self._client = None
+        self._down_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Whether Redis is connected and the circuit is closed."""
+        return self._client is not None and time.monotonic() >= self._down_until
+
+    async def connect(self) -> None:
+        """Create the Redis client (connections are opened lazily)."""
+        if not self.url:
+            logger.info("REDIS_URL not set; Redis response cache disabled.")
+            return
+        if aioredis is None:
+            logger.warning(
+                "redis package not installed; Redis response cache disabled. Install with 'pip install redis'"
+            )
+            return
+        self._client = aioredis.from_url(
+            self.url,
+            password=self.password,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.socket_timeout,
+        )
+        logger.info("Redis response cache configured.")
+
+    async def close(self) -> None:
+        """Close the Redis client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _trip(self, error: Exception) -> None:
+        logger.warning(
+            f"Redis cache unavailable, bypassing for {self.failure_cooldown:.0f}s: {error}"
+        )
+        self._down_until = time.monotonic() + self.failure_cooldown
+
+    async def ping(self) -> Optional[bool]:
+        """
+        Check that Redis answers.
+
+        Returns None when the cache is not configured, otherwise whether the
+        server replied. A failed ping opens the circuit like any other error.
+        """
+        if self._client is None:
+            return None
+        if not self.available:
+            return False
+        try:
+            return bool(await self._client.ping())
+        except Exception as e:
+            self._trip(e)
+            return False
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value for key, or None on a miss or error."""
+        if not self.available:
+            return None
+        try:
+            return await self._client.get(self.prefix + key)
+        except Exception as e:
+            self._trip(e)
+            return None
+
+    async def set(self, key: str, value: Union[bytes, str], ttl: int) -> None:
+        """Store value under key for ttl seconds."""
+        if not self.available:
+            return
+        try:
+            await self._client.set(self.prefix + key, value, ex=ttl)
+        except Exception as e:
+            self._trip(e)
+
+    async def delete(self, *keys: str) -> None:
+        """Delete the given keys."""
+        if not keys or not self.available:
+            return
+        try:
+            await self._client.delete(*(self.prefix + key for key in keys))
+        except Exception as e:
+            self._trip(e)
+
+    async def delete_pattern(self, pattern: str) -> None:
+        """Delete every key matching a glob-style pattern, using SCAN."""
+        if not self.available:
+            return
+        try:
+            batch = []
+            async for key in self._client.scan_iter(match=self.prefix + pattern):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await self._client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                await self._client.unlink(*batch)
+        except Exception as e:
+            self._trip(e)
+
+
+# Create a global cache instance (connected in the application lifespan)
+redis_cache = RedisCache(
+    url=settings.cache.REDIS_URL if settings.cache.CACHE_ENABLED else None,
+    password=(
+        settings.cache.REDIS_PASSWORD.get_secret_value()
+        if settings.cache.REDIS_PASSWORD
+        else None
+    ),
+    prefix=settings.cache.CACHE_PREFIX,
+)
@@ -0,0 +1,110 @@
+"""
+TwinSecure - Advanced Cybersecurity Platform
+Copyright © 2024 TwinSecure. All rights reserved.
+
+This file is part of TwinSecure, a proprietary cybersecurity platform.
+Unauthorized copying, distribution, modification, or use of this software
+is strictly prohibited without explicit written permission.
+
+For licensing inquiries: kunalsingh2514@gmail.com
+"""
+
+"""
+In-process background job queue for work that outlives a request.
+
+Each job runs in a worker task with its own database session, so jobs never
+hold on to the request-scoped session that FastAPI closes once the response
+is sent. The number of workers bounds how many pooled connections the jobs
+can take at once, so a burst cannot starve the API of connections.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import logger
+from app.db.session import AsyncSessionLocal
+
+JobHandler = Callable[[AsyncSession, Any], Awaitable[Any]]
+
+
+class JobQueue:
+    """
+    Bounded queue of jobs processed by a fixed pool of worker tasks.
+    """
+
+    def __init__(
+        self, name: str, handler: JobHandler, workers: int = 4, max_size: int = 10000
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            name: Name used in log messages
+            handler: Coroutine called as handler(db, item) for each job
+            workers: Number of worker tasks (and so of concurrent sessions)
+            max_size: Maximum number of queued jobs
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the workers are accepting jobs."""
+        return bool(self._tasks) and not self._closing
+
+    async def start(self) -> None:
+        """Start the worker tasks."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._closing = False
+        self._tasks = [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+        logger.info("%s queue started with %d workers.", self.name, self.workers)
+
+    async def stop(self) -> None:
+        """Stop the workers once every queued job has been processed."""
+        if not self._tasks:
+            return
+        self._closing = True
+        # Each worker exits when it reaches a sentinel
+        for _ in self._tasks:
+            await self._queue.put(None)
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
+        logger.info("%s queue stopped.", self.name)
+
+    def enqueue(self, item: Any) -> None:
+        """
+        Queue a job for the workers.
+
+        Raises:
+            RuntimeError: If the queue is not running
+            asyncio.QueueFull: If the queue is full
+        """
+        if not self.running:
+            raise RuntimeError(f"{self.name} queue is not running")
+        self._queue.put_nowait(item)
+
+    async def run(self, item: Any) -> None:
+        """Run a single job in a new database session."""
+        try:
+            async with AsyncSessionLocal() as db:
+                await self.handler(db, item)
+        except Exception as e:
+            logger.error("%s job failed: %s", self.name, e, exc_info=True)
+
+    async def _work(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            await self.run(item)
@@ -9,6 +9,7 @@ is strictly prohibited without explicit written permission.
 For licensing inquiries: kunalsingh2514@gmail.com
 """
 
+import functools
 import ipaddress
 import re
 from datetime import datetime
@@ -163,6 +164,8 @@ def validate_ip_address(ip: str) -> bool:
     return all(0 <= int(octet) <= 255 for octet in ip.split("."))
 
 
+# Honeypot traffic repeats the same scanner addresses, so remember results
+@functools.lru_cache(maxsize=16384)
 def validate_ip(ip: str) -> bool:
     """
     Validate IP address format.
@@ -0,0 +1,48 @@
+"""
+TwinSecure - Advanced Cybersecurity Platform
+Copyright © 2024 TwinSecure. All rights reserved.
+
+This file is part of TwinSecure, a proprietary cybersecurity platform.
+Unauthorized copying, distribution, modification, or use of this software
+is strictly prohibited without explicit written permission.
+
+For licensing inquiries: kunalsingh2514@gmail.com
+"""
+
+#!/usr/bin/env python
+"""
+OpenAPI schema export script.
+This script writes the application's OpenAPI schema to a JSON file so it can
+be served as a static asset when the API runs without its docs endpoints.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.main import app
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Export the OpenAPI schema")
+    parser.add_argument(
+        "output",
+        nargs="?",
+        default="openapi.json",
+        help="Output file (default: openapi.json)",
+    )
+    args = parser.parse_args()
+
+    # Generated even when openapi_url is disabled for production
+    schema = app.openapi()
+    Path(args.output).write_text(json.dumps(schema, indent=2), encoding="utf-8")
+    print(f"OpenAPI schema written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,7 @@ from app.core.config import settings
 async def check_database_exists():
     """Check if the database exists, and create it if it doesn't"""
     # Connect to the default postgres database to check if our database exists
-    connection_string = f"postgresql+asyncpg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD.get_secret_value()}@{settings.POSTGRES_SERVER}:{settings.POSTGRES_PORT}/postgres"
+    connection_string = f"postgresql+asyncpg://{settings.database.POSTGRES_USER}:{settings.database.POSTGRES_PASSWORD.get_secret_value()}@{settings.database.POSTGRES_SERVER}:{settings.database.POSTGRES_PORT}/postgres"
     
     from sqlalchemy.ext.asyncio import create_async_engine
     temp_engine = create_async_engine(connection_string)
@@ -36,18 +36,18 @@ async def check_database_exists():
         async with temp_engine.connect() as conn:
             # Check if the database exists
             result = await conn.execute(text(
-                f"SELECT 1 FROM pg_database WHERE datname = '{settings.POSTGRES_DB}'"
+                f"SELECT 1 FROM pg_database WHERE datname = '{settings.database.POSTGRES_DB}'"
             ))
             exists = result.scalar()
             
             if not exists:
-                print(f"Database '{settings.POSTGRES_DB}' does not exist. Creating...")
+                print(f"Database '{settings.database.POSTGRES_DB}' does not exist. Creating...")
                 # Need to commit to execute CREATE DATABASE
                 await conn.execute(text("COMMIT"))
-                await conn.execute(text(f"CREATE DATABASE \"{settings.POSTGRES_DB}\""))
-                print(f"Database '{settings.POSTGRES_DB}' created successfully.")
+                await conn.execute(text(f"CREATE DATABASE \"{settings.database.POSTGRES_DB}\""))
+                print(f"Database '{settings.database.POSTGRES_DB}' created successfully.")
             else:
-                print(f"Database '{settings.POSTGRES_DB}' already exists.")
+                print(f"Database '{settings.database.POSTGRES_DB}' already exists.")
             
             return True
     except Exception as e:
@@ -37,9 +37,9 @@ from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, Generator, List
 from uuid import UUID, uuid4
 
+import jwt
 import pytest
 from fastapi.testclient import TestClient
-from jose import jwt
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
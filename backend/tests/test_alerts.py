@@ -97,3 +97,51 @@ def test_create_alert(client, user_auth_headers):
     response = client.get("/api/v1/alerts/", headers=user_auth_headers)
     alerts = response.json()
     assert any(alert["id"] == created_alert["id"] for alert in alerts)
+
+
+def test_alert_update_is_visible_to_the_next_read(monkeypatch):
+    """Test that a GET after a PATCH returns the updated alert, not a cached one."""
+    import uuid
+    from datetime import datetime, timezone
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.api.api_v1.endpoints import alerts
+    from app.core.dependencies import get_current_active_user
+    from app.db.session import get_db
+    from app.main import app as main_app
+    from app.middleware.cache_middleware import response_cache
+    from app.schemas import Alert
+
+    stored = Alert(
+        id=uuid.uuid4(),
+        alert_type="Honeypot Triggered",
+        notes="before",
+        created_at=datetime.now(timezone.utc),
+    )
+    store = {"alert": stored}
+
+    async def get(db, alert_id):
+        return store["alert"]
+
+    async def update_by_id(db, alert_id, obj_in):
+        previous = store["alert"]
+        store["alert"] = previous.model_copy(update=obj_in)
+        return store["alert"], previous.status
+
+    monkeypatch.setattr(alerts.crud.alert, "get", get)
+    monkeypatch.setattr(alerts.crud.alert, "update_by_id", update_by_id)
+    for name in ("get", "set", "delete", "delete_pattern"):
+        monkeypatch.setattr(alerts.redis_cache, name, AsyncMock(return_value=None))
+    overrides = main_app.dependency_overrides
+    for dependency in (get_db, get_current_active_user):
+        monkeypatch.setitem(overrides, dependency, lambda: MagicMock())
+    response_cache.clear()
+
+    client = TestClient(main_app)
+    url = f"/api/v1/alerts/{stored.id}"
+    try:
+        assert client.get(url).json()["notes"] == "before"
+        assert client.patch(url, json={"notes": "after"}).status_code == 200
+        assert client.get(url).json()["notes"] == "after"
+    finally:
+        response_cache.clear()
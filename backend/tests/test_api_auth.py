@@ -140,8 +140,8 @@ async def test_login_success(db_session: AsyncSession):
     # Verify token contains correct user info
     payload = jwt.decode(
         token_data["access_token"],
-        settings.SECURITY__SECRET_KEY.get_secret_value(),
-        algorithms=[settings.SECURITY__ALGORITHM]
+        settings.security.SECRET_KEY.get_secret_value(),
+        algorithms=[settings.security.ALGORITHM]
     )
     assert payload["sub"] == str(user.id)
     assert payload["email"] == email
@@ -193,7 +193,7 @@ async def test_refresh_token_success(db_session: AsyncSession):
 
     # Create a valid refresh token
     refresh_token_expires = timedelta(
-        days=settings.SECURITY__REFRESH_TOKEN_EXPIRE_DAYS
+        days=settings.security.REFRESH_TOKEN_EXPIRE_DAYS
     )
     refresh_token = create_access_token(
         subject=str(user.id),
@@ -214,8 +214,8 @@ async def test_refresh_token_success(db_session: AsyncSession):
     # Verify token contains correct user info
     payload = jwt.decode(
         token_data["access_token"],
-        settings.SECURITY__SECRET_KEY.get_secret_value(),
-        algorithms=[settings.SECURITY__ALGORITHM]
+        settings.security.SECRET_KEY.get_secret_value(),
+        algorithms=[settings.security.ALGORITHM]
     )
     assert payload["sub"] == str(user.id)
     assert payload["email"] == email
@@ -332,7 +332,7 @@ def test_create_access_token():
 
     # Decode the token
     decoded = jwt.decode(
-        token, settings.SECURITY__SECRET_KEY.get_secret_value(), algorithms=[settings.SECURITY__ALGORITHM]
+        token, settings.security.SECRET_KEY.get_secret_value(), algorithms=[settings.security.ALGORITHM]
     )
 
     # Check that the subject matches
@@ -342,7 +342,75 @@ def test_create_access_token():
     assert "exp" in decoded
     exp_delta = datetime.fromtimestamp(decoded["exp"], tz=timezone.utc) - datetime.now(timezone.utc)
     assert (
-        timedelta(minutes=settings.SECURITY__ACCESS_TOKEN_EXPIRE_MINUTES - 1)
+        timedelta(minutes=settings.security.ACCESS_TOKEN_EXPIRE_MINUTES - 1)
         < exp_delta
-        < timedelta(minutes=settings.SECURITY__ACCESS_TOKEN_EXPIRE_MINUTES + 1)
+        < timedelta(minutes=settings.security.ACCESS_TOKEN_EXPIRE_MINUTES + 1)
     )
+
+
+def test_decode_token_caches_valid_tokens_until_expiry(monkeypatch):
+    """Test that a decoded token is reused until its exp claim."""
+    import uuid
+
+    from app.core import security
+
+    monkeypatch.setattr(security, "_TOKEN_CACHE", security.OrderedDict())
+    calls = []
+    real_decode = security._decode_hs256
+
+    def counting_decode(token):
+        calls.append(token)
+        return real_decode(token)
+
+    monkeypatch.setattr(security, "_decode_hs256", counting_decode)
+    user_id = uuid.uuid4()
+    token = create_access_token(subject=user_id, expires_delta=timedelta(minutes=5))
+
+    first = security.decode_token(token)
+    assert first.sub == user_id
+    assert security.decode_token(token) is first
+    assert len(calls) == 1
+
+    # Invalid tokens are never cached
+    assert security.decode_token(token + "x") is None
+    assert security.decode_token(token + "x") is None
+    assert len(calls) == 3
+
+    # Once exp has passed the cached entry is dropped and the token re-verified
+    monkeypatch.setattr(security.time, "time", lambda: 2**40)
+    security.decode_token(token)
+    assert len(calls) == 4
+
+
+def test_fast_hs256_decode_matches_pyjwt(monkeypatch):
+    """Test that the HS256 fast path accepts and rejects what jwt.decode does."""
+    from app.core import security
+
+    monkeypatch.setattr(security, "_TOKEN_CACHE", security.OrderedDict())
+    secret = settings.security.SECRET_KEY.get_secret_value()
+    algorithm = settings.security.ALGORITHM
+    user_id = uuid4()
+    token = create_access_token(subject=user_id, expires_delta=timedelta(minutes=5))
+
+    assert security._decode_hs256(token) == jwt.decode(
+        token, secret, algorithms=[algorithm]
+    )
+    signing_input, signature = token.rsplit(".", 1)
+    tampered = ("B" if signature[0] == "A" else "A") + signature[1:]
+    with pytest.raises(jwt.InvalidSignatureError):
+        security._decode_hs256(f"{signing_input}.{tampered}")
+
+    expired = create_access_token(subject=user_id, expires_delta=timedelta(minutes=-1))
+    with pytest.raises(jwt.ExpiredSignatureError):
+        security._decode_hs256(expired)
+    assert security.decode_token(expired) is None
+
+    # Tokens with other claims are left to jwt.decode
+    exp = datetime.now(timezone.utc) + timedelta(minutes=5)
+    other = jwt.encode(
+        {"sub": str(user_id), "exp": exp, "iat": datetime.now(timezone.utc)},
+        secret,
+        algorithm=algorithm,
+    )
+    assert security._decode_hs256(other) is None
+    assert security.decode_token(other).sub == user_id
@@ -45,6 +45,107 @@ def test_users_crud():
     # Further tests require superuser token, which you can add here
 
 
+@pytest.mark.asyncio
+async def test_user_list_is_paginated_and_loads_only_listing_columns():
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.api.api_v1.endpoints import users
+    from app.db.crud.crud_user import user as crud_user
+
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    await crud_user.get_multi(db, skip=50, limit=50, columns=users.USER_LIST_COLUMNS)
+
+    stmt = db.execute.call_args.args[0]
+    sql = str(stmt.compile())
+    assert "users.email" in sql
+    assert "users.preferences" not in sql
+    assert "users.mfa_secret" not in sql
+    assert "LIMIT" in sql and "OFFSET" in sql
+
+
+@pytest.mark.asyncio
+async def test_user_list_stream_is_json_array():
+    """Streamed user lists are one JSON array, read through a cursor."""
+    import json
+    import uuid
+    from datetime import datetime, timezone
+    from unittest.mock import MagicMock, patch
+
+    from app.api.api_v1 import streaming
+    from app.api.api_v1.endpoints import users
+    from app.db.models import User
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        User(
+            id=uuid.uuid4(),
+            email=f"user{n}@example.com",
+            is_active=True,
+            is_superuser=False,
+            created_at=now,
+        )
+        for n in range(3)
+    ]
+    calls = []
+
+    async def stream_multi(db, *, skip, columns):
+        calls.append(skip)
+        for row in rows:
+            yield row
+
+    session = MagicMock()
+    session.return_value.__aenter__.return_value = MagicMock()
+    with patch.object(streaming, "AsyncSessionLocal", session), patch.object(
+        users.crud.user, "stream_multi", stream_multi
+    ):
+        response = await users.list_users(
+            skip=10, limit=50, stream=True, db=MagicMock(), current_user=MagicMock()
+        )
+        chunks = [chunk async for chunk in response.body_iterator]
+
+    body = json.loads(b"".join(chunks))
+    assert [item["email"] for item in body] == [row.email for row in rows]
+    assert calls == [10]
+
+
+@pytest.mark.asyncio
+async def test_user_update_by_id_is_a_single_statement():
+    import uuid
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.db.crud.crud_user import user as crud_user
+
+    result = MagicMock()
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+
+    updated = await crud_user.update_by_id(
+        db, user_id=uuid.uuid4(), obj_in={"full_name": "Ada", "email": "Ada@X.io"}
+    )
+    assert updated is result.scalar_one_or_none.return_value
+    db.execute.assert_awaited_once()
+    stmt = db.execute.call_args.args[0]
+    sql = str(stmt.compile())
+    assert sql.startswith("UPDATE users") and "RETURNING" in sql
+    assert stmt.compile().params["email"] == "ada@x.io"
+
+    # Unknown IDs come back as None, which the endpoint turns into a 404
+    result.scalar_one_or_none.return_value = None
+    assert (
+        await crud_user.update_by_id(
+            db, user_id=uuid.uuid4(), obj_in={"full_name": "Ada"}
+        )
+        is None
+    )
+
+    with pytest.raises(ValueError):
+        await crud_user.update_by_id(
+            db, user_id=uuid.uuid4(), obj_in={"email": "not-an-email"}
+        )
+
+
 def test_system_health():
     response = client.get("/api/v1/system/health")
     assert response.status_code == 200
@@ -53,3 +154,167 @@ def test_system_health():
 
 
 # Add more tests for reports, honeypot, and other endpoints as needed
+
+
+def test_api_routes_include_after_direct_submodule_import():
+    """Test that importing an endpoint module directly leaves inclusion working."""
+    from fastapi import APIRouter
+
+    import app.api.api_v1.endpoints.dashboard  # noqa: F401
+    from app.api.api_v1.api import include_api_routes
+
+    router = APIRouter()
+    include_api_routes(router, prefix="/api/v1")
+    paths = {route.path for route in router.routes}
+    assert "/api/v1/dashboard/security-metrics" in paths
+    assert "/api/v1/users/" in paths
+
+
+@pytest.mark.parametrize(
+    "name, url",
+    [
+        ("alerts", "/api/v1/alerts/?limit=500"),
+        ("reports", "/api/v1/reports/list?stream=true"),
+        ("users", "/api/v1/users/?stream=true"),
+    ],
+)
+def test_streamed_lists_bypass_response_cache(monkeypatch, name, url):
+    """Test that streamed list bodies pass through CacheMiddleware unbuffered."""
+    from unittest.mock import MagicMock
+
+    from app.api.api_v1 import streaming
+    from app.core.dependencies import (
+        get_current_active_superuser,
+        get_current_active_user,
+    )
+    from app.db import crud
+    from app.db.session import get_db
+    from app.main import app as main_app
+    from app.middleware.cache_middleware import response_cache
+
+    async def no_rows(*args, **kwargs):
+        return
+        yield
+
+    session = MagicMock()
+    session.return_value.__aenter__.return_value = MagicMock()
+    monkeypatch.setattr(streaming, "AsyncSessionLocal", session)
+    crud_name = {"alerts": "alert", "reports": "report", "users": "user"}[name]
+    monkeypatch.setattr(getattr(crud, crud_name), "stream_multi", no_rows)
+    overrides = main_app.dependency_overrides
+    for dependency in (get_db, get_current_active_user, get_current_active_superuser):
+        monkeypatch.setitem(overrides, dependency, lambda: MagicMock())
+    response_cache.clear()
+
+    response = TestClient(main_app).get(url)
+    assert response.status_code == 200
+    assert response.content == b"[]"
+    assert "x-cache" not in response.headers
+    assert response_cache.get_stats()["size"] == 0
+
+
+def test_cache_middleware_stores_only_full_responses():
+    """Test that a 304 is never cached or replayed to another request."""
+    from fastapi import FastAPI, Request, Response
+
+    from app.middleware.cache_middleware import CacheMiddleware, ResponseCache
+
+    cache = ResponseCache()
+    app = FastAPI()
+    app.add_middleware(CacheMiddleware, cache_instance=cache)
+
+    @app.get("/api/v1/items")
+    async def items(request: Request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return Response(status_code=304, headers={"ETag": '"v1"'})
+        return Response(content=b"[]", headers={"ETag": '"v1"'})
+
+    client = TestClient(app)
+    conditional = client.get("/api/v1/items", headers={"If-None-Match": '"v1"'})
+    assert conditional.status_code == 304
+    assert cache.get_stats()["size"] == 0
+
+    plain = client.get("/api/v1/items")
+    assert plain.status_code == 200 and plain.content == b"[]"
+    assert plain.headers["x-cache"] == "MISS"
+    assert client.get("/api/v1/items").headers["x-cache"] == "HIT"
+
+
+def test_response_compression_is_outermost_middleware():
+    """Test that gzip wraps the whole stack so cached bodies stay uncompressed."""
+    from starlette.middleware.gzip import GZipMiddleware
+
+    from app.core.config import settings
+    from app.main import app as main_app
+
+    if not settings.ENABLE_COMPRESSION:
+        pytest.skip("Response compression is disabled")
+
+    outermost = main_app.user_middleware[0]
+    assert outermost.cls is GZipMiddleware
+    assert outermost.kwargs["minimum_size"] == settings.COMPRESSION_MINIMUM_SIZE
+
+
+@pytest.mark.parametrize(
+    "paths",
+    [
+        ("/dashboard/", "/honeypot/", "/reports/"),
+        ("/system/status", "/system/health"),
+    ],
+)
+def test_routes_serialize_with_orjson(paths):
+    """Test that API routes inherit the app-wide ORJSONResponse."""
+    from fastapi.responses import ORJSONResponse
+    from fastapi.routing import APIRoute
+
+    from app.core.config import settings
+    from app.main import app as main_app
+
+    prefixes = tuple(settings.API_V1_STR + path for path in paths)
+    routes = [
+        route
+        for route in main_app.routes
+        if isinstance(route, APIRoute) and route.path.startswith(prefixes)
+    ]
+    # Every listed path (or prefix) is served by at least one route
+    for prefix in prefixes:
+        assert any(route.path.startswith(prefix) for route in routes), prefix
+    assert all(route.response_class is ORJSONResponse for route in routes)
+
+
+def test_routes_are_registered_once():
+    """Test that no path and method pair is served by two handlers."""
+    from collections import Counter
+
+    from fastapi.routing import APIRoute
+
+    from app.main import app as main_app
+
+    registrations = Counter(
+        (route.path, method)
+        for route in main_app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    )
+    assert [key for key, count in registrations.items() if count > 1] == []
+
+
+def test_cache_middleware_matches_path_prefixes():
+    """Test that cache exclusions come from settings and match by prefix."""
+    from types import SimpleNamespace
+
+    from app.core.config import settings
+    from app.middleware.cache_middleware import CacheMiddleware
+
+    middleware = CacheMiddleware(app=None)
+    assert middleware.exclude_paths == tuple(settings.cache.CACHE_EXCLUDE_PATHS)
+
+    def request(path, method="GET"):
+        return SimpleNamespace(method=method, url=SimpleNamespace(path=path))
+
+    assert middleware.is_cacheable(request("/api/v1/reports/list"))
+    assert not middleware.is_cacheable(request("/api/v1/reports/list", "POST"))
+    assert not middleware.is_cacheable(request("/api/v1/alerts/"))
+    assert not middleware.is_cacheable(request("/api/v1/auth/login"))
+    assert not middleware.is_cacheable(request("/api/v1/users/me"))
+    assert not middleware.is_cacheable(request("/metrics"))
@@ -0,0 +1,262 @@
+"""
+TwinSecure - Advanced Cybersecurity Platform
+Copyright © 2024 TwinSecure. All rights reserved.
+
+This file is part of TwinSecure, a proprietary cybersecurity platform.
+Unauthorized copying, distribution, modification, or use of this software
+is strictly prohibited without explicit written permission.
+
+For licensing inquiries: kunalsingh2514@gmail.com
+"""
+
+"""
+Tests for the dashboard endpoints.
+"""
+
+from typing import Dict
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_security_metrics_risk_score():
+    """Test the integer risk score, including the no-alerts case."""
+    from unittest.mock import MagicMock
+
+    from app.api.api_v1.endpoints.dashboard import (
+        DashboardContext,
+        get_security_metrics_internal,
+    )
+
+    async def risk_score(by_severity: Dict[str, int]) -> int:
+        ctx = DashboardContext(alerts_by_severity=by_severity, alerts_by_status={})
+        metrics = await get_security_metrics_internal(MagicMock(), MagicMock(), ctx)
+        return metrics.risk_score
+
+    assert await risk_score({"critical": 0, "high": 0, "medium": 0, "low": 0}) == 0
+    # 58 / 200 * 100 is 28.999... in floating point; the exact score is 29
+    assert await risk_score({"medium": 29, "low": 171}) == 29
+    assert await risk_score({"critical": 5, "low": 5}) == 100
+
+
+@pytest.mark.asyncio
+async def test_dashboard_sections_share_one_timestamp():
+    """Test that dashboard sections derive their timestamps from the given now."""
+    from datetime import datetime, timedelta, timezone
+    from unittest.mock import MagicMock
+
+    from app.api.api_v1.endpoints.dashboard import (
+        get_alert_trends_internal,
+        get_digital_twin_status_internal,
+        get_top_attackers_internal,
+    )
+
+    now = datetime(2025, 5, 17, 12, 0, tzinfo=timezone.utc)
+    db, user = MagicMock(), MagicMock()
+
+    trends = await get_alert_trends_internal(db, 3, user, now=now)
+    attackers = await get_top_attackers_internal(db, 1, user, now=now)
+    twin = await get_digital_twin_status_internal(db, user, now=now)
+
+    assert trends[-1].date == "2025-05-16"
+    assert attackers[0].last_seen == (now - timedelta(hours=2)).isoformat()
+    assert twin.last_engagement == (now - timedelta(hours=3)).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_dashboard_fast_path_matches_validated_models(monkeypatch):
+    """Test that skipping validation for trusted aggregates changes no output."""
+    import warnings
+    from datetime import datetime, timezone
+    from unittest.mock import MagicMock
+
+    from app.api.api_v1.endpoints import dashboard
+
+    now = datetime(2025, 5, 17, 12, 0, tzinfo=timezone.utc)
+    db, user = MagicMock(), MagicMock()
+
+    async def render() -> bytes:
+        ctx = dashboard.DashboardContext(
+            alerts_by_severity={"critical": 1, "high": 2, "medium": 3},
+            alerts_by_status={"new": 6},
+        )
+        sections = {
+            "trends": await dashboard.get_alert_trends_internal(db, 7, user, now=now),
+            "distribution": await dashboard.get_alert_severity_distribution_internal(
+                db, user, ctx
+            ),
+            "attackers": await dashboard.get_top_attackers_internal(
+                db, 8, user, now=now
+            ),
+            "compliance": await dashboard.get_compliance_status_internal(
+                db, user, now=now
+            ),
+            "twin": await dashboard.get_digital_twin_status_internal(
+                db, user, now=now
+            ),
+        }
+        return dashboard._DASHBOARD_ADAPTER.dump_json(sections)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        fast = await render()
+    monkeypatch.setattr(dashboard, "_TRUSTED_FAST_PATH", False)
+    assert await render() == fast
+
+
+def test_dashboard_etag_short_circuits_unchanged_body():
+    """Test that a matching If-None-Match gets an empty 304."""
+    from starlette.requests import Request
+
+    from app.api.api_v1.endpoints import dashboard
+
+    def request(if_none_match: str = None) -> Request:
+        headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+        return Request({"type": "http", "headers": headers})
+
+    body = b'{"total_alerts":3}'
+    first = dashboard._json_response(request(), body)
+    etag = first.headers["etag"]
+    assert first.status_code == 200 and first.body == body
+    assert etag.startswith('W/"')
+
+    # Strong and weak forms of the tag both match
+    for sent in (etag, etag[2:], f'"other", {etag}'):
+        not_modified = dashboard._json_response(request(sent), body)
+        assert not_modified.status_code == 304
+        assert not_modified.body == b""
+        assert not_modified.headers["etag"] == etag
+
+    changed = dashboard._json_response(request(etag), b'{"total_alerts":4}')
+    assert changed.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_dashboard_endpoint_errors_become_500(monkeypatch):
+    """Test that dashboard endpoints turn unexpected errors into a 500."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from fastapi import HTTPException
+
+    from app.api.api_v1.endpoints import dashboard
+
+    monkeypatch.setattr(
+        dashboard,
+        "get_top_attackers_internal",
+        AsyncMock(side_effect=RuntimeError("boom")),
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await dashboard.get_top_attackers(
+            limit=5, db=MagicMock(), current_user=MagicMock()
+        )
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.detail == "Failed to retrieve top attackers"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_data_serializes_full_response(monkeypatch):
+    """Test that the full dashboard body matches the DashboardResponse schema."""
+    import json
+    from unittest.mock import AsyncMock, MagicMock
+
+    from starlette.requests import Request
+
+    from app.api.api_v1.endpoints import dashboard
+    from app.schemas import DashboardResponse
+
+    counts = {
+        "by_severity": {"critical": 1, "high": 2, "medium": 3, "low": 0, "info": 0},
+        "by_status": {"new": 6, "acknowledged": 0, "resolved": 0},
+    }
+    monkeypatch.setattr(
+        dashboard.crud.alert, "get_counts_grouped", AsyncMock(return_value=counts)
+    )
+
+    response = await dashboard.get_dashboard_data(
+        request=Request({"type": "http", "headers": []}),
+        days=7,
+        db=MagicMock(),
+        current_user=MagicMock(),
+    )
+
+    body = json.loads(response.body)
+    assert list(body) == list(DashboardResponse.model_fields)
+    assert DashboardResponse.model_validate(body).securityMetrics.total_alerts == 6
+    assert len(body["alertTrends"]) == 7
+
+
+@pytest.mark.asyncio
+async def test_dashboard_summary_uses_summary_counts(monkeypatch):
+    """Test that the summary reads its counts from the single summary query."""
+    import json
+    from unittest.mock import AsyncMock, MagicMock
+
+    from starlette.requests import Request
+
+    from app.api.api_v1.endpoints import dashboard
+
+    counts = {"total": 100, "critical": 1, "high": 2, "medium": 3}
+    summary_counts = AsyncMock(return_value=counts)
+    grouped_counts = AsyncMock()
+    monkeypatch.setattr(dashboard.crud.alert, "get_summary_counts", summary_counts)
+    monkeypatch.setattr(dashboard.crud.alert, "get_counts_grouped", grouped_counts)
+
+    response = await dashboard.get_dashboard_summary(
+        request=Request({"type": "http", "headers": []}),
+        db=MagicMock(),
+        current_user=MagicMock(),
+    )
+
+    body = json.loads(response.body)
+    assert body["total_alerts"] == 100
+    assert body["critical_alerts"] == 1
+    assert body["high_alerts"] == 2
+    # (1 * 10 + 2 * 5 + 3 * 2) * 100 // 100
+    assert body["risk_score"] == 26
+    summary_counts.assert_awaited_once()
+    grouped_counts.assert_not_called()
+
+
+def test_dashboard_reads_bypass_response_cache(monkeypatch):
+    """Test that dashboard reads follow the Redis cache, not CacheMiddleware."""
+    from unittest.mock import MagicMock
+
+    from fastapi.testclient import TestClient
+
+    from app.api.api_v1.endpoints import dashboard
+    from app.core.dependencies import get_current_active_user
+    from app.db.session import get_db
+    from app.main import app as main_app
+    from app.middleware.cache_middleware import response_cache
+
+    # What Redis holds for the dashboard; alert writes replace or delete it
+    redis_body = [b'{"total_alerts":3}']
+
+    async def redis_get(key):
+        return redis_body[0]
+
+    monkeypatch.setattr(dashboard.redis_cache, "get", redis_get)
+    overrides = main_app.dependency_overrides
+    for dependency in (get_db, get_current_active_user):
+        monkeypatch.setitem(overrides, dependency, lambda: MagicMock())
+    response_cache.clear()
+
+    client = TestClient(main_app)
+    try:
+        first = client.get("/api/v1/dashboard/")
+        assert first.content == b'{"total_alerts":3}'
+        assert "x-cache" not in first.headers
+
+        not_modified = client.get(
+            "/api/v1/dashboard/", headers={"If-None-Match": first.headers["etag"]}
+        )
+        assert not_modified.status_code == 304
+
+        # A new alert shows up on the next read
+        redis_body[0] = b'{"total_alerts":4}'
+        second = client.get("/api/v1/dashboard/")
+        assert second.status_code == 200
+        assert second.content == b'{"total_alerts":4}'
+    finally:
+        response_cache.clear()
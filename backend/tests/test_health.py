@@ -24,3 +24,164 @@ def test_health_check():
     assert response.status_code == 200
     data = response.json()
     assert "status" in data
+
+
+def test_liveness_and_readiness_before_startup():
+    from app.main import app as main_app
+
+    # Without entering the client context the lifespan never runs
+    main_client = TestClient(main_app)
+    assert main_client.get("/health/live").status_code == 200
+    response = main_client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+
+def test_system_health_probes_run_concurrently(monkeypatch):
+    import asyncio
+    import time
+
+    from app.api.api_v1.endpoints import system
+
+    async def slow_ok():
+        await asyncio.sleep(0.2)
+        return "ok"
+
+    async def failing():
+        raise ConnectionError("unreachable")
+
+    async def hanging():
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(system.settings, "HEALTH_CACHE_TTL", 0)
+    monkeypatch.setattr(system, "HEALTH_CHECK_TIMEOUT", 0.5)
+    monkeypatch.setattr(
+        system,
+        "_HEALTH_CHECKS",
+        {"database": slow_ok, "cache": failing, "storage": slow_ok},
+    )
+    start = time.perf_counter()
+    health = asyncio.run(system.get_system_health())
+    assert time.perf_counter() - start < 0.35
+    assert health["status"] == "error"
+    assert health["components"] == {
+        "database": "ok",
+        "cache": "error",
+        "storage": "ok",
+    }
+
+    # A probe that hangs is reported as an error once it times out
+    monkeypatch.setattr(system, "_HEALTH_CHECKS", {"database": hanging})
+    health = asyncio.run(system.get_system_health())
+    assert health["components"] == {"database": "error"}
+
+
+def test_system_health_is_cached(monkeypatch):
+    import asyncio
+
+    from app.api.api_v1.endpoints import system
+
+    calls = []
+
+    async def counting():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    async def burst():
+        return await asyncio.gather(*(system.get_system_health() for _ in range(20)))
+
+    monkeypatch.setattr(system, "_HEALTH_CHECKS", {"database": counting})
+    monkeypatch.setattr(system, "_HEALTH_CACHE", None)
+    monkeypatch.setattr(system.settings, "HEALTH_CACHE_TTL", 60)
+
+    # A burst of concurrent requests shares a single probe
+    results = asyncio.run(burst())
+    assert len(calls) == 1
+    assert all(result == results[0] for result in results)
+
+    # Once the TTL has passed the components are probed again
+    monkeypatch.setattr(system.settings, "HEALTH_CACHE_TTL", 0)
+    asyncio.run(system.get_system_health())
+    assert len(calls) == 2
+
+
+def test_utc_timestamp_is_reused_within_a_second(monkeypatch):
+    import datetime
+
+    from app.api.api_v1.endpoints import system
+
+    clock = [1700000000.1]
+    monkeypatch.setattr(system.time, "time", lambda: clock[0])
+
+    first = system._utc_timestamp()
+    assert first == "2023-11-14T22:13:20+00:00"
+    assert datetime.datetime.fromisoformat(first).tzinfo is not None
+    clock[0] = 1700000000.9
+    assert system._utc_timestamp() is first
+    clock[0] = 1700000001.0
+    assert system._utc_timestamp() == "2023-11-14T22:13:21+00:00"
+
+
+def test_system_status_reuses_mock_models():
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.api.api_v1.endpoints import system
+
+    user = SimpleNamespace(email="admin@example.com")
+
+    first = asyncio.run(system.get_system_status(current_user=user))
+    second = asyncio.run(system.get_system_status(current_user=user))
+    assert first.metrics is second.metrics is system._MOCK_SYSTEM_METRICS
+    assert first.overall_status == "DEGRADED"
+    assert [s.name for s in second.service_statuses] == [
+        s.name for s in system._MOCK_SERVICE_STATUSES
+    ]
+
+
+@pytest.mark.parametrize(
+    "statuses, expected",
+    [
+        (("UP", "UP"), "HEALTHY"),
+        (("UP", "DEGRADED", "UP"), "DEGRADED"),
+        (("DEGRADED", "DOWN", "UP"), "UNHEALTHY"),
+        (("DOWN", "DEGRADED"), "UNHEALTHY"),
+    ],
+)
+def test_system_status_overall_status(monkeypatch, statuses, expected):
+    import asyncio
+    from types import SimpleNamespace
+
+    from app.api.api_v1.endpoints import system
+    from app.schemas import ServiceStatus
+
+    services = tuple(
+        ServiceStatus(name=f"service-{i}", status=value)
+        for i, value in enumerate(statuses)
+    )
+
+    async def mock_statuses():
+        return services
+
+    monkeypatch.setattr(system, "get_mock_service_statuses", mock_statuses)
+    user = SimpleNamespace(email="admin@example.com")
+    result = asyncio.run(system.get_system_status(current_user=user))
+    assert result.overall_status == expected
+
+
+def test_database_health_check_pings_on_a_pooled_connection(monkeypatch):
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.api.api_v1.endpoints import system
+
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+    engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    monkeypatch.setattr(system, "engine", engine)
+
+    assert asyncio.run(system._check_database()) == "ok"
+    assert str(conn.execute.call_args.args[0]) == "SELECT 1"
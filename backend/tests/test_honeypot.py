@@ -13,6 +13,8 @@ For licensing inquiries: kunalsingh2514@gmail.com
 Tests for honeypot endpoints.
 """
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -49,3 +51,90 @@ def test_get_honeypot_unauthenticated(client):
     response = client.get("/api/v1/honeypot/")
     assert response.status_code == 401
     assert response.json() == {"detail": "Not authenticated"}
+
+
+@pytest.mark.asyncio
+async def test_process_honeypot_data_survives_enrichment_failure():
+    """Test that one failing enrichment provider does not drop the other."""
+    from app.api.api_v1.endpoints import honeypot
+    from app.schemas import HoneypotData
+
+    data = HoneypotData(timestamp="2024-01-01T00:00:00Z", sourceIp="203.0.113.7")
+    create = AsyncMock(return_value=MagicMock(id="alert-id"))
+
+    with patch.object(
+        honeypot, "get_geoip_data", AsyncMock(side_effect=RuntimeError("down"))
+    ), patch.object(
+        honeypot, "get_abuseipdb_score", AsyncMock(return_value=42)
+    ), patch.object(
+        honeypot.crud.alert, "create", create
+    ), patch.object(
+        honeypot.alert_client, "send_alert", AsyncMock()
+    ):
+        await honeypot.process_honeypot_data(MagicMock(), data)
+
+    alert_in = create.call_args.kwargs["obj_in"]
+    assert alert_in.ip_info is None
+    assert alert_in.abuse_score == 42
+
+
+@pytest.mark.asyncio
+async def test_alerts_buffer_writes_in_batches():
+    """Queued alerts are written in batches and flushed on stop."""
+    from app.schemas import AlertCreate
+    from app.services.alerts_buffer import AlertWriteBuffer
+
+    buffer = AlertWriteBuffer(batch_size=2, flush_interval=60)
+    alert_in = AlertCreate(alert_type="honeypot_trigger", source_ip="203.0.113.7")
+
+    # Not running: callers write directly
+    assert buffer.submit(alert_in) is None
+
+    flush = AsyncMock()
+    with patch.object(buffer, "_flush", flush):
+        await buffer.start()
+        alerts = [buffer.submit(alert_in) for _ in range(3)]
+        await buffer.stop()
+
+    assert all(alert is not None and alert.id is not None for alert in alerts)
+    assert [len(call.args[0]) for call in flush.call_args_list] == [2, 1]
+    # Only table columns are sent to the INSERT
+    assert "notes" not in flush.call_args_list[0].args[0][0]
+    assert buffer.submit(alert_in) is None
+
+
+@pytest.mark.asyncio
+async def test_job_queue_runs_jobs_in_own_sessions():
+    """Queued jobs each get a fresh session and are drained on stop."""
+    from app.services import job_queue
+
+    sessions = []
+
+    class FakeSession:
+        async def __aenter__(self):
+            session = MagicMock()
+            sessions.append(session)
+            return session
+
+        async def __aexit__(self, *exc):
+            return False
+
+    handled = []
+
+    async def handler(db, item):
+        handled.append((db, item))
+
+    queue = job_queue.JobQueue("Test", handler, workers=2)
+    with patch.object(job_queue, "AsyncSessionLocal", FakeSession):
+        with pytest.raises(RuntimeError):
+            queue.enqueue("early")
+        await queue.start()
+        for item in range(5):
+            queue.enqueue(item)
+        await queue.stop()
+
+    assert sorted(item for _, item in handled) == [0, 1, 2, 3, 4]
+    # One new session per job
+    assert len(sessions) == 5
+    assert {id(db) for db, _ in handled} == set(map(id, sessions))
+    assert not queue.running
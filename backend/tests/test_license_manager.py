@@ -0,0 +1,147 @@
+"""
+TwinSecure - Advanced Cybersecurity Platform
+Copyright © 2024 TwinSecure. All rights reserved.
+
+This file is part of TwinSecure, a proprietary cybersecurity platform.
+Unauthorized copying, distribution, modification, or use of this software
+is strictly prohibited without explicit written permission.
+
+For licensing inquiries: kunalsingh2514@gmail.com
+"""
+
+"""
+Tests for the license manager.
+"""
+
+from unittest.mock import patch
+
+from app.core.license_manager import LicenseManager
+
+
+def test_hardware_id_is_computed_once():
+    manager = LicenseManager()
+    with patch(
+        "app.core.license_manager.uuid.getnode", return_value=0x0A1B2C3D4E5F
+    ) as getnode:
+        first = manager.hardware_id
+        assert manager.hardware_id == first
+    assert len(first) == 16
+    # getnode is called once per MAC byte, all during the first access
+    assert getnode.call_count == 6
+
+
+def test_fernet_is_shared_and_uses_configured_key(monkeypatch):
+    from cryptography.fernet import Fernet
+
+    key = Fernet.generate_key()
+    monkeypatch.setenv("LICENSE_ENCRYPTION_KEY", key.decode())
+    monkeypatch.setattr(LicenseManager, "_fernet", None)
+
+    first, second = LicenseManager(), LicenseManager()
+    assert first.fernet is second.fernet
+    # The configured key is used, not silently replaced by a generated one
+    assert Fernet(key).decrypt(first.fernet.encrypt(b"trial")) == b"trial"
+
+
+def test_license_key_validation():
+    manager = LicenseManager()
+    assert manager._is_valid_key("TS-DEV-UNLIMITED-ACCESS")
+    assert manager._is_valid_key("TS-ACME-0123456789")
+    # Too short, too few parts, or the wrong prefix
+    assert not manager._is_valid_key("TS-ACME-1234")
+    assert not manager._is_valid_key("TS-ACME0123456789")
+    assert not manager._is_valid_key("XX-ACME-0123456789")
+
+
+def test_trial_check_is_cached_by_file_mtime(tmp_path, monkeypatch):
+    import os
+
+    monkeypatch.chdir(tmp_path)
+    manager = LicenseManager()
+
+    # The first check starts the trial and writes the trial file
+    assert manager.check_trial_period()
+    assert (tmp_path / LicenseManager.TRIAL_FILE).exists()
+
+    calls = []
+    real_decrypt = manager.fernet.decrypt
+
+    def counting_decrypt(token):
+        calls.append(token)
+        return real_decrypt(token)
+
+    monkeypatch.setattr(manager.fernet, "decrypt", counting_decrypt)
+    assert manager.check_trial_period()
+    assert manager.check_trial_period()
+    assert calls == []
+
+    # A changed file is read again
+    trial_file = tmp_path / LicenseManager.TRIAL_FILE
+    stat = trial_file.stat()
+    os.utime(trial_file, (stat.st_atime, stat.st_mtime + 10))
+    assert manager.check_trial_period()
+    assert len(calls) == 1
+
+
+def test_corrupted_trial_file_is_retried_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = LicenseManager()
+    (tmp_path / LicenseManager.TRIAL_FILE).write_bytes(b"not a fernet token")
+
+    # A corrupted file is replaced by a fresh trial
+    assert manager.check_trial_period()
+
+    # A file that cannot be replaced (say another worker keeps rewriting it)
+    # gives up after one retry
+    manager._trial_cache = None
+    calls = []
+
+    def failing_decrypt(token):
+        calls.append(token)
+        raise ValueError("corrupted")
+
+    monkeypatch.setattr(manager.fernet, "decrypt", failing_decrypt)
+    monkeypatch.setattr("app.core.license_manager.os.remove", lambda path: None)
+    assert not manager.check_trial_period()
+    assert len(calls) == 2
+
+
+def test_validate_license_reuses_one_client():
+    import asyncio
+
+    import httpx
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "license_key": "TS-ACME-0123456789",
+                "organization": "Acme",
+                "expires_at": "2099-01-01T00:00:00+00:00",
+                "features": {"ml_enabled": True},
+                "max_users": 10,
+                "hardware_id": "0123456789abcdef",
+            },
+        )
+
+    async def run():
+        manager = LicenseManager()
+        client = manager._http = httpx.AsyncClient(
+            base_url=manager.license_server_url,
+            transport=httpx.MockTransport(handler),
+        )
+        first = await manager.validate_license("TS-ACME-0123456789")
+        second = await manager.validate_license("TS-ACME-0123456789")
+        assert manager._http_client() is client
+        await manager.aclose()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.organization == second.organization == "Acme"
+    assert all(request.url.path == "/validate" for request in requests)
+    # The second call is answered from the validation cache
+    assert len(requests) == 1
+    assert second is first
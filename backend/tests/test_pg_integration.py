@@ -120,6 +120,70 @@ async def test_alert_update(pg_db: AsyncSession):
     assert alert.severity == AlertSeverity.HIGH
 
 
+@pytest.mark.asyncio
+async def test_alert_update_by_id(pg_db: AsyncSession):
+    """Test single-statement alert update in PostgreSQL."""
+    from app.db.crud.crud_alert import alert as crud_alert
+
+    # Create a test alert
+    alert = await create_test_alert(pg_db)
+
+    # Update the alert and get its previous status back
+    result = await crud_alert.update_by_id(
+        pg_db, alert_id=alert.id, obj_in={"status": AlertStatus.RESOLVED}
+    )
+    assert result is not None
+    updated_alert, previous_status = result
+    assert previous_status == AlertStatus.NEW
+    assert updated_alert.status == AlertStatus.RESOLVED
+
+    # Unknown IDs return None
+    missing = await crud_alert.update_by_id(
+        pg_db, alert_id=uuid.uuid4(), obj_in={"status": AlertStatus.RESOLVED}
+    )
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_alert_exists(pg_db: AsyncSession):
+    """Test alert existence check in PostgreSQL."""
+    from app.db.crud.crud_alert import alert as crud_alert
+
+    alert = await create_test_alert(pg_db)
+
+    assert await crud_alert.exists(pg_db, alert.id) is True
+    assert await crud_alert.exists(pg_db, uuid.uuid4()) is False
+
+
+@pytest.mark.asyncio
+async def test_alert_counts(pg_db: AsyncSession):
+    """Test alert counts by severity and status in PostgreSQL."""
+    from app.db.crud.crud_alert import alert as crud_alert
+
+    before = await crud_alert.get_count_by_severity(pg_db)
+    await create_test_alert(pg_db)
+
+    by_severity = await crud_alert.get_count_by_severity(pg_db)
+    by_status = await crud_alert.get_count_by_status(pg_db)
+    assert set(by_severity) == {severity.value for severity in AlertSeverity}
+    assert set(by_status) == {alert_status.value for alert_status in AlertStatus}
+    assert by_severity["medium"] == before["medium"] + 1
+    assert by_status["new"] >= 1
+
+    # The single-query variant agrees with the separate counts
+    grouped = await crud_alert.get_counts_grouped(pg_db)
+    assert grouped == {"by_severity": by_severity, "by_status": by_status}
+
+    # So do the dashboard summary counts
+    summary = await crud_alert.get_summary_counts(pg_db)
+    assert summary == {
+        "total": sum(by_severity.values()),
+        "critical": by_severity["critical"],
+        "high": by_severity["high"],
+        "medium": by_severity["medium"],
+    }
+
+
 @pytest.mark.asyncio
 async def test_alert_delete(pg_db: AsyncSession):
     """Test alert deletion in PostgreSQL."""
@@ -47,3 +47,147 @@ def test_get_reports_unauthenticated(client):
     response = client.get("/api/v1/reports/")
     assert response.status_code == 401
     assert response.json() == {"detail": "Not authenticated"}
+
+
+@pytest.mark.asyncio
+async def test_report_list_loads_only_listing_columns():
+    """The report list query selects only the columns it returns."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.api.api_v1.endpoints.reports import REPORT_LIST_COLUMNS
+    from app.db.crud.crud_report import report as crud_report
+    from app.schemas import ReportQueryFilters
+
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    await crud_report.get_multi(
+        db, filters=ReportQueryFilters(), columns=REPORT_LIST_COLUMNS
+    )
+
+    sql = str(db.execute.call_args.args[0].compile())
+    assert "reports.file_location" in sql
+    assert "reports.summary" not in sql
+    assert "reports.change_history" not in sql
+
+
+@pytest.mark.asyncio
+async def test_report_list_keyset_pagination():
+    """The report list continues after the cursor instead of using OFFSET."""
+    import uuid
+    from datetime import datetime, timezone
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.db.crud.crud_report import report as crud_report
+    from app.db.models import Report
+    from app.schemas import ReportQueryFilters
+
+    last = Report(id=uuid.uuid4(), generated_at=datetime.now(timezone.utc))
+    cursor = crud_report.encode_cursor(last)
+    assert crud_report.decode_cursor(cursor) == (last.generated_at, last.id)
+    with pytest.raises(ValueError):
+        crud_report.decode_cursor("not-a-cursor")
+
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    await crud_report.get_multi(db, filters=ReportQueryFilters(cursor=cursor))
+
+    sql = str(db.execute.call_args.args[0].compile())
+    assert "(reports.generated_at, reports.id) <" in sql
+    assert "ORDER BY reports.generated_at DESC, reports.id DESC" in sql
+
+
+@pytest.mark.asyncio
+async def test_report_list_stream_is_json_array():
+    """Streamed report lists are one JSON array."""
+    import json
+    import uuid
+    from datetime import datetime, timezone
+    from unittest.mock import MagicMock, patch
+
+    from fastapi import Response
+
+    from app.api.api_v1 import streaming
+    from app.api.api_v1.endpoints import reports
+    from app.db.models import Report
+    from app.schemas import ReportQueryFilters
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        Report(
+            id=uuid.uuid4(),
+            title=f"Report {n}",
+            filename=f"report-{n}.pdf",
+            file_location=f"s3://reports/report-{n}.pdf",
+            generated_at=now,
+            created_at=now,
+        )
+        for n in range(3)
+    ]
+
+    async def stream_multi(db, *, filters, columns):
+        assert columns == reports.REPORT_LIST_COLUMNS
+        for row in rows:
+            yield row
+
+    session = MagicMock()
+    session.return_value.__aenter__.return_value = MagicMock()
+    with patch.object(streaming, "AsyncSessionLocal", session), patch.object(
+        reports.crud.report, "stream_multi", stream_multi
+    ):
+        response = await reports.list_reports(
+            response=Response(),
+            stream=True,
+            db=MagicMock(),
+            filters=ReportQueryFilters(),
+            current_user=MagicMock(),
+        )
+        chunks = [chunk async for chunk in response.body_iterator]
+
+    body = json.loads(b"".join(chunks))
+    assert [item["title"] for item in body] == ["Report 0", "Report 1", "Report 2"]
+
+
+def test_report_list_pages_keep_their_cursor(monkeypatch):
+    """Every paged report list, up to the largest limit, carries X-Next-Cursor."""
+    import uuid
+    from datetime import datetime, timezone
+    from unittest.mock import AsyncMock, MagicMock
+
+    from fastapi.testclient import TestClient
+
+    from app.api.api_v1.endpoints import reports
+    from app.core.dependencies import get_current_active_user
+    from app.db.models import Report
+    from app.db.session import get_db
+    from app.main import app as main_app
+    from app.middleware.cache_middleware import response_cache
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        Report(
+            id=uuid.uuid4(),
+            title=f"Report {n}",
+            filename=f"report-{n}.pdf",
+            file_location=f"s3://reports/report-{n}.pdf",
+            generated_at=now,
+            created_at=now,
+        )
+        for n in range(150)
+    ]
+    monkeypatch.setattr(
+        reports.crud.report, "get_multi", AsyncMock(return_value=rows)
+    )
+    overrides = main_app.dependency_overrides
+    for dependency in (get_db, get_current_active_user):
+        monkeypatch.setitem(overrides, dependency, lambda: MagicMock())
+    response_cache.clear()
+
+    try:
+        response = TestClient(main_app).get("/api/v1/reports/list?limit=150")
+    finally:
+        response_cache.clear()
+    assert response.status_code == 200
+    assert len(response.json()) == 150
+    assert response.headers["x-next-cursor"] == reports.crud.report.encode_cursor(
+        rows[-1]
+    )
@@ -192,3 +192,76 @@ def test_xss_protection(client: TestClient, user_auth_headers: Dict[str, str]):
             # Here we're just checking that it's returned as-is
             assert data["title"] == payload
             assert data["description"] == payload
+
+
+def test_password_regex_is_compiled_once():
+    """Test that the password pattern is compiled once per settings instance."""
+    from app.core.config import SecuritySettings
+
+    security = SecuritySettings()
+    assert security.PASSWORD_REGEX is security.PASSWORD_REGEX
+    assert security.PASSWORD_REGEX.pattern == security.PASSWORD_PATTERN
+    assert security.PASSWORD_REGEX.fullmatch("correct-h0rse!battery") is None
+    assert security.PASSWORD_REGEX.fullmatch("correcth0rse!battery")
+
+    # An overridden pattern is the one that gets compiled
+    custom = SecuritySettings(PASSWORD_PATTERN=r"^\d{4}$")
+    assert custom.PASSWORD_REGEX.fullmatch("1234")
+    assert "PASSWORD_REGEX" not in custom.model_dump()
+
+
+def test_security_settings_read_prefixed_environment(monkeypatch):
+    """Test that SECURITY__* variables populate the nested security settings."""
+    from app.core.config import SecuritySettings, Settings
+
+    monkeypatch.setenv("SECURITY__ALGORITHM", "HS512")
+    monkeypatch.setenv("SECURITY__ACCESS_TOKEN_EXPIRE_MINUTES", "5")
+
+    security = SecuritySettings()
+    assert security.ALGORITHM == "HS512"
+    assert security.ACCESS_TOKEN_EXPIRE_MINUTES == 5
+
+    # The flat duplicates are gone; the nested section is the only copy
+    assert "SECURITY__ALGORITHM" not in Settings.model_fields
+    assert "POSTGRES_SERVER" not in Settings.model_fields
+    assert "CACHE_PREFIX" not in Settings.model_fields
+
+
+def test_database_url_is_built_unless_provided(monkeypatch):
+    """Test that DATABASE_URL is assembled from POSTGRES_* unless set directly."""
+    from app.core.config import DatabaseSettings
+
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    database = DatabaseSettings(POSTGRES_PASSWORD="p@ss", POSTGRES_SERVER="db")
+    assert database.DATABASE_URL == (
+        "postgresql+asyncpg://postgres:p%40ss@db:5432/TwinSecure"
+    )
+
+    provided = "sqlite+aiosqlite:///./test.db"
+    assert DatabaseSettings(DATABASE_URL=provided).DATABASE_URL == provided
+
+
+def test_comma_separated_list_settings_are_split():
+    """Test that CORS origins and alert recipients accept comma-separated strings."""
+    from app.core.config import Settings
+
+    parsed = Settings(
+        BACKEND_CORS_ORIGINS="http://a.test, http://b.test",
+        ALERT_RECIPIENTS="ciso@example.com, soc@example.com,",
+    )
+    assert parsed.BACKEND_CORS_ORIGINS == ["http://a.test", "http://b.test"]
+    assert parsed.ALERT_RECIPIENTS == ["ciso@example.com", "soc@example.com"]
+
+    with pytest.raises(ValueError):
+        Settings(ALERT_RECIPIENTS="not-an-email")
+
+
+def test_password_hash_round_trip(monkeypatch):
+    """Test that passwords are hashed as standard bcrypt and verify."""
+    from app.core import password
+
+    monkeypatch.setattr(password, "BCRYPT_ROUNDS", 4)
+    hashed = password.get_password_hash("correcth0rse!battery")
+    assert hashed.startswith("$2b$04$")
+    assert password.verify_password("correcth0rse!battery", hashed)
+    assert not password.verify_password("correcth0rse!battery2", hashed)
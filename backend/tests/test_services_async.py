@@ -28,6 +28,7 @@ from app.services.alerting.client import AlertingClient
 from app.services.alerting.discord import DiscordAlerter
 from app.services.alerting.email import EmailAlerter
 from app.services.alerting.slack import SlackAlerter
+from app.services.cache import RedisCache
 from app.services.enrichment.abuseipdb import AbuseIPDBClient
 from app.services.enrichment.geoip import GeoIPClient
 from app.services.rate_limiter import RateLimiter
@@ -413,3 +414,56 @@ class TestValidation:
         assert validate_hostname("example..com") == False
         assert validate_hostname("-example.com") == False
         assert validate_hostname("") == False
+
+
+class TestRedisCache:
+    """Tests for the RedisCache class."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_url(self):
+        """Test that the cache is a no-op when no Redis URL is configured."""
+        cache = RedisCache(url=None)
+        await cache.connect()
+
+        assert cache.available is False
+        assert await cache.get("alert:1") is None
+        await cache.set("alert:1", b"{}", ttl=60)
+        await cache.delete("alert:1")
+
+    @pytest.mark.asyncio
+    async def test_get_set_delete(self):
+        """Test that keys are prefixed and passed through to Redis."""
+        cache = RedisCache(url="redis://localhost:6379/0", prefix="test:")
+        client = MagicMock()
+        client.get = AsyncMock(return_value=b'{"id": 1}')
+        client.set = AsyncMock()
+        client.delete = AsyncMock()
+        cache._client = client
+
+        assert await cache.get("alert:1") == b'{"id": 1}'
+        client.get.assert_awaited_once_with("test:alert:1")
+
+        await cache.set("alert:1", b"{}", ttl=60)
+        client.set.assert_awaited_once_with("test:alert:1", b"{}", ex=60)
+
+        await cache.delete("alert:1", "alert:2")
+        client.delete.assert_awaited_once_with("test:alert:1", "test:alert:2")
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker(self):
+        """Test that a Redis error bypasses the cache until the cooldown ends."""
+        cache = RedisCache(url="redis://localhost:6379/0", failure_cooldown=30)
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=ConnectionError("refused"))
+        cache._client = client
+
+        assert await cache.get("alert:1") is None
+        assert cache.available is False
+
+        # Further calls short-circuit without touching Redis
+        assert await cache.get("alert:1") is None
+        assert client.get.await_count == 1
+
+        # Once the cooldown has passed, Redis is tried again
+        cache._down_until = 0.0
+        assert cache.available is True
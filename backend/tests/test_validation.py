@@ -28,6 +28,11 @@ def test_validate_ip():
     assert validate_ip("not_an_ip") == False
     assert validate_ip("") == False
 
+    # Repeat lookups are served from the cache
+    hits = validate_ip.cache_info().hits
+    assert validate_ip("192.168.1.1") == True
+    assert validate_ip.cache_info().hits == hits + 1
+
     print("All IP validation tests passed!")
 
 
@@ -190,7 +190,7 @@ USER appuser
 EXPOSE 8000
 
 # Run application
-CMD ["uvicorn", "backend.app.main:app", "--host", "0.0.0.0", "--port", "8000"]
+CMD ["uvicorn", "backend.app.main:app", "--host", "0.0.0.0", "--port", "8000", "--loop", "uvloop", "--http", "httptools"]
 '''
         
         with open(self.protected_dir / "Dockerfile.backend", 'w') as f: